@@ -5,6 +5,16 @@ This package contains demonstration utilities and examples
 for using the MCP tools.
 """
 
-from .tool_demos import MCPToolDemo, example_cleaned_trace_demo, example_tools_list
+from .tool_demos import (
+    MCPToolDemo,
+    example_cleaned_trace_demo,
+    example_tools_list,
+    run_examples,
+)
 
-__all__ = ["MCPToolDemo", "example_cleaned_trace_demo", "example_tools_list"]
+__all__ = [
+    "MCPToolDemo",
+    "example_cleaned_trace_demo",
+    "example_tools_list",
+    "run_examples",
+]
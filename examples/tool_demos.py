@@ -3,17 +3,73 @@ Example utilities for demonstrating MCP tool usage
 """
 
 import asyncio
-import json
+import re
+from contextlib import AsyncExitStack
 from typing import Any
 
-from fastmcp import Client
+from gitlab_analyzer.utils.tool_calls import TOOL_CALL_TIMEOUT, json_loads, safe_call
+
+# Divider printed between examples
+SEPARATOR = "=" * 50
+
+# Collapses runs of whitespace in tool descriptions
+_WS_RE = re.compile(r"\s+")
+
+
+def _unwrap_result(result: Any) -> Any:
+    """Return the payload of a tool call result, decoding JSON text only if needed"""
+    if isinstance(result, dict):
+        return result
+
+    # Structured tool output is already decoded by the client
+    structured = getattr(result, "structured_content", None)
+    if structured is not None:
+        return structured
+
+    content = getattr(result, "content", None)
+    if content:
+        return json_loads(content[0].text)
+    return result
 
 
 class MCPToolDemo:
     """Demonstration utilities for MCP tools"""
 
-    def __init__(self, server_script: str = "server.py"):
+    def __init__(
+        self, server_script: str = "server.py", tool_timeout: float = TOOL_CALL_TIMEOUT
+    ):
         self.server_script = server_script
+        self.tool_timeout = tool_timeout
+        self._client = None
+        self._stack: AsyncExitStack | None = None
+        self._tools: list[dict[str, str]] | None = None
+
+    async def __aenter__(self) -> "MCPToolDemo":
+        """Open one server session shared by every demo call in the block"""
+        self._stack = AsyncExitStack()
+        await self._stack.enter_async_context(self.client)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the shared server session"""
+        if self._stack is not None:
+            await self._stack.aclose()
+            self._stack = None
+
+    @property
+    def client(self):
+        """
+        FastMCP client for the server script, created once per demo
+
+        The client is reentrant, so demo calls made inside
+        ``async with MCPToolDemo() as demo:`` reuse the session opened on
+        entry instead of connecting to the server for every call.
+        """
+        if self._client is None:
+            from fastmcp import Client
+
+            self._client = Client(self.server_script)
+        return self._client
 
     async def demonstrate_cleaned_trace_tool(
         self, project_id: str, job_id: int
@@ -28,17 +84,16 @@ class MCPToolDemo:
         Returns:
             Demonstration results with statistics
         """
-        client = Client(self.server_script)
-        async with client:
+        async with self.client as client:
             # Get cleaned trace
-            result = await client.call_tool(
-                "get_cleaned_job_trace", {"project_id": project_id, "job_id": job_id}
+            result = await safe_call(
+                client,
+                "get_cleaned_job_trace",
+                {"project_id": project_id, "job_id": job_id},
+                self.tool_timeout,
             )
 
-            if hasattr(result, "content") and result.content:
-                trace_data = json.loads(result.content[0].text)
-            else:
-                trace_data = result
+            trace_data = _unwrap_result(result)
 
             return trace_data
 
@@ -55,28 +110,19 @@ class MCPToolDemo:
         Returns:
             Comparison results
         """
-        client = Client(self.server_script)
-        async with client:
-            # Get raw trace
-            raw_result = await client.call_tool(
-                "get_job_trace", {"project_id": project_id, "job_id": job_id}
-            )
-
-            # Get cleaned trace
-            cleaned_result = await client.call_tool(
-                "get_cleaned_job_trace", {"project_id": project_id, "job_id": job_id}
+        async with self.client as client:
+            # Get raw and cleaned traces concurrently
+            arguments = {"project_id": project_id, "job_id": job_id}
+            raw_result, cleaned_result = await asyncio.gather(
+                safe_call(client, "get_job_trace", arguments, self.tool_timeout),
+                safe_call(
+                    client, "get_cleaned_job_trace", arguments, self.tool_timeout
+                ),
             )
 
             # Process results
-            if hasattr(raw_result, "content") and raw_result.content:
-                raw_data = json.loads(raw_result.content[0].text)
-            else:
-                raw_data = raw_result
-
-            if hasattr(cleaned_result, "content") and cleaned_result.content:
-                cleaned_data = json.loads(cleaned_result.content[0].text)
-            else:
-                cleaned_data = cleaned_result
+            raw_data = _unwrap_result(raw_result)
+            cleaned_data = _unwrap_result(cleaned_result)
 
             return {
                 "raw_trace": raw_data,
@@ -96,45 +142,52 @@ class MCPToolDemo:
             }
 
     async def list_available_tools(self) -> list:
-        """List all available MCP tools"""
-        client = Client(self.server_script)
-        async with client:
-            tools = await client.list_tools()
-            return [
+        """
+        List all available MCP tools
+
+        Tools are listed through the demo's server session, and the list is
+        kept for later calls since the server's tools do not change.
+        """
+        if self._tools is None:
+            async with self.client as client:
+                tools = await client.list_tools()
+            self._tools = [
                 {
                     "name": tool.name,
                     "description": (
-                        " ".join(tool.description.split())
+                        _WS_RE.sub(" ", tool.description).strip()
                         if tool.description
                         else "No description"
                     ),
                 }
                 for tool in tools
             ]
+        return self._tools
 
 
 # Example usage functions
 async def example_cleaned_trace_demo():
     """Example: Demonstrate cleaned trace tool"""
-    demo = MCPToolDemo()
-
     # Note: These are example values - replace with actual project/job IDs
     project_id = "19133"
     job_id = 2009734
 
     try:
-        result = await demo.demonstrate_cleaned_trace_tool(project_id, job_id)
+        async with MCPToolDemo() as demo:
+            result = await demo.demonstrate_cleaned_trace_tool(project_id, job_id)
 
         if "error" in result:
             print(f"Error: {result['error']}")
             return
 
         stats = result.get("cleaning_stats", {})
-        print("Cleaned Trace Tool Demo Results:")
-        print(f"  Original length: {stats.get('original_length', 0):,} chars")
-        print(f"  Cleaned length: {stats.get('cleaned_length', 0):,} chars")
-        print(f"  Reduction: {stats.get('reduction_percentage', 0)}%")
-        print(f"  ANSI sequences: {stats.get('ansi_sequences_found', 0)}")
+        print(
+            "Cleaned Trace Tool Demo Results:\n"
+            f"  Original length: {stats.get('original_length', 0):,} chars\n"
+            f"  Cleaned length: {stats.get('cleaned_length', 0):,} chars\n"
+            f"  Reduction: {stats.get('reduction_percentage', 0)}%\n"
+            f"  ANSI sequences: {stats.get('ansi_sequences_found', 0)}"
+        )
 
     except Exception as e:
         print(f"Demo failed: {e}")
@@ -146,19 +199,23 @@ async def example_tools_list():
 
     try:
         tools = await demo.list_available_tools()
-        print("Available MCP Tools:")
+        lines = ["Available MCP Tools:"]
         for i, tool in enumerate(tools, 1):
-            print(f"  {i:2d}. {tool['name']}")
-            print(f"      {tool['description']}")
-            print()
+            lines.append(f"  {i:2d}. {tool['name']}\n      {tool['description']}\n")
+        print("\n".join(lines))
     except Exception as e:
         print(f"Failed to list tools: {e}")
 
 
+async def run_examples():
+    """Run all examples on a single event loop"""
+    await example_tools_list()
+    print(f"\n{SEPARATOR}\n")
+    await example_cleaned_trace_demo()
+
+
 if __name__ == "__main__":
     # Run examples
     print("Running MCP Tool Examples...")
 
-    asyncio.run(example_tools_list())
-    print("\n" + "=" * 50 + "\n")
-    asyncio.run(example_cleaned_trace_demo())
+    asyncio.run(run_examples())
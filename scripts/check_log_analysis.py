@@ -18,7 +18,7 @@ def main():
     print("=== ALL LOG ENTRIES ===")
     for i, entry in enumerate(entries, 1):
         print(f"{i}. {entry.level.upper()}: {entry.message}")
-        if hasattr(entry, "line_number") and entry.line_number:
+        if entry.line_number:
             print(f"   Line: {entry.line_number}")
         print()
 
@@ -26,10 +26,14 @@ def main():
 
     # Check for specific patterns
     print("\n=== ANALYSIS ===")
-    test_failures = [
-        e for e in entries if "test_" in e.message and "in test_" in e.message
-    ]
-    general_errors = [e for e in entries if e not in test_failures]
+    test_failures = []
+    general_errors = []
+    for e in entries:
+        # "in test_" already contains "test_", so one substring check suffices
+        if "in test_" in e.message:
+            test_failures.append(e)
+        else:
+            general_errors.append(e)
 
     print(f"Test failures: {len(test_failures)}")
     for tf in test_failures:
@@ -10,23 +10,57 @@ Licensed under the MIT License
 """
 
 import os
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
 
+# Section dividers
+SEPARATOR = "=" * 50
+SUBSEPARATOR = "-" * 30
+
+# (description, command) pairs shown after a successful environment check
+USAGE_EXAMPLES = (
+    (
+        "Analyze a single job",
+        "python get_job_result.py --project-id 12345 --job-id 67890",
+    ),
+    (
+        "Get pipeline status",
+        "python get_job_result.py --project-id 12345 --pipeline-id 11111 --status-only",
+    ),
+    (
+        "Analyze failed pipeline",
+        "python get_job_result.py --project-id 12345 --pipeline-id 11111 --analyze-failures",
+    ),
+    (
+        "Get failed jobs only",
+        "python get_job_result.py --project-id 12345 --pipeline-id 11111 --failed-jobs-only",
+    ),
+    (
+        "Output as JSON",
+        "python get_job_result.py --project-id 12345 --job-id 67890 --json",
+    ),
+)
+
 
 def check_environment():
     """Check if environment is properly configured"""
-    print("🔍 GitLab Job Result Analyzer - Environment Check")
-    print("=" * 50)
+    lines = ["🔍 GitLab Job Result Analyzer - Environment Check", SEPARATOR]
 
     # Check environment variables
-    gitlab_url = os.getenv("GITLAB_URL")
-    gitlab_token = os.getenv("GITLAB_TOKEN")
+    gitlab_url = os.environ.get("GITLAB_URL")
+    gitlab_token = os.environ.get("GITLAB_TOKEN")
+    missing_vars = [
+        name
+        for name, value in (("GITLAB_URL", gitlab_url), ("GITLAB_TOKEN", gitlab_token))
+        if not value
+    ]
 
-    print("📋 Environment Variables:")
+    lines.append("📋 Environment Variables:")
     if gitlab_url:
-        print(f"   ✅ GITLAB_URL: {gitlab_url}")
+        lines.append(f"   ✅ GITLAB_URL: {gitlab_url}")
     else:
-        print("   ❌ GITLAB_URL: Not set")
+        lines.append("   ❌ GITLAB_URL: Not set")
 
     if gitlab_token:
         token_preview = (
@@ -34,81 +68,62 @@ def check_environment():
             if len(gitlab_token) > 12
             else "*" * len(gitlab_token)
         )
-        print(f"   ✅ GITLAB_TOKEN: {token_preview}")
+        lines.append(f"   ✅ GITLAB_TOKEN: {token_preview}")
     else:
-        print("   ❌ GITLAB_TOKEN: Not set")
+        lines.append("   ❌ GITLAB_TOKEN: Not set")
 
     # Check server script
     server_script = Path("server.py")
-    print("\n📄 MCP Server Script:")
-    if server_script.exists():
-        print(f"   ✅ server.py: Found ({server_script.stat().st_size} bytes)")
+    lines.append("\n📄 MCP Server Script:")
+    has_server_script = server_script.exists()
+    if has_server_script:
+        lines.append(f"   ✅ server.py: Found ({server_script.stat().st_size} bytes)")
     else:
-        print("   ❌ server.py: Not found")
+        lines.append("   ❌ server.py: Not found")
 
     # Check Python dependencies
-    print("\n📦 Python Dependencies:")
-    try:
-        import fastmcp
-
-        print(f"   ✅ fastmcp: {fastmcp.__version__}")
-    except ImportError:
-        print("   ❌ fastmcp: Not installed")
+    lines.append("\n📦 Python Dependencies:")
+    if find_spec("fastmcp") is not None:
+        try:
+            fastmcp_version = version("fastmcp")
+        except PackageNotFoundError:
+            # Importable without distribution metadata, e.g. a source checkout
+            fastmcp_version = "unknown version"
+        lines.append(f"   ✅ fastmcp: {fastmcp_version}")
+    else:
+        lines.append("   ❌ fastmcp: Not installed")
 
     # Overall status
-    print("\n🎯 Overall Status:")
-    if gitlab_url and gitlab_token and server_script.exists():
-        print("   ✅ Ready to use GitLab Job Result Analyzer!")
-        print("\n📚 Next steps:")
-        print("   1. Try: python get_job_result.py --help")
-        print(
+    lines.append("\n🎯 Overall Status:")
+    if not missing_vars and has_server_script:
+        lines.append("   ✅ Ready to use GitLab Job Result Analyzer!")
+        lines.append("\n📚 Next steps:")
+        lines.append("   1. Try: python get_job_result.py --help")
+        lines.append(
             "   2. Example: python get_job_result.py --project-id YOUR_PROJECT_ID --pipeline-id YOUR_PIPELINE_ID --status-only"
         )
-        print("   3. See CLIENT_README.md for full documentation")
+        lines.append("   3. See CLIENT_README.md for full documentation")
+        print("\n".join(lines))
         return True
     else:
-        print("   ❌ Environment not ready")
-        print("\n🔧 Required setup:")
-        if not gitlab_url:
-            print("   - Set GITLAB_URL environment variable")
-        if not gitlab_token:
-            print("   - Set GITLAB_TOKEN environment variable")
-        if not server_script.exists():
-            print("   - Ensure server.py exists in current directory")
+        lines.append("   ❌ Environment not ready")
+        lines.append("\n🔧 Required setup:")
+        lines.extend(f"   - Set {name} environment variable" for name in missing_vars)
+        if not has_server_script:
+            lines.append("   - Ensure server.py exists in current directory")
+        print("\n".join(lines))
         return False
 
 
 def show_usage_examples():
     """Show usage examples"""
-    print("\n📖 Usage Examples:")
-    print("-" * 30)
-
-    examples = [
-        (
-            "Analyze a single job",
-            "python get_job_result.py --project-id 12345 --job-id 67890",
-        ),
-        (
-            "Get pipeline status",
-            "python get_job_result.py --project-id 12345 --pipeline-id 11111 --status-only",
-        ),
-        (
-            "Analyze failed pipeline",
-            "python get_job_result.py --project-id 12345 --pipeline-id 11111 --analyze-failures",
-        ),
-        (
-            "Get failed jobs only",
-            "python get_job_result.py --project-id 12345 --pipeline-id 11111 --failed-jobs-only",
-        ),
-        (
-            "Output as JSON",
-            "python get_job_result.py --project-id 12345 --job-id 67890 --json",
-        ),
-    ]
+    lines = ["\n📖 Usage Examples:", SUBSEPARATOR]
+
+    for description, command in USAGE_EXAMPLES:
+        lines.append(f"\n{description}:")
+        lines.append(f"   {command}")
 
-    for description, command in examples:
-        print(f"\n{description}:")
-        print(f"   {command}")
+    print("\n".join(lines))
 
 
 def main():
@@ -118,8 +133,7 @@ def main():
     if ready:
         show_usage_examples()
 
-    print("\n" + "=" * 50)
-    print("For full documentation, see CLIENT_README.md")
+    print(f"\n{SEPARATOR}\nFor full documentation, see CLIENT_README.md")
 
 
 if __name__ == "__main__":
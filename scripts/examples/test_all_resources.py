@@ -14,107 +14,120 @@ sys.path.insert(0, str(project_root))
 # Import after path modification
 from src.gitlab_analyzer.mcp.servers.server import create_server  # noqa: E402
 
+# Divider between report sections
+SEPARATOR = "=" * 60
+
+# Supported response modes and what each one returns
+MODE_DESCRIPTIONS = {
+    "minimal": "Essential info only (~200 bytes per error)",
+    "balanced": "Essential + limited context (~500 bytes per error) [DEFAULT]",
+    "fixing": "Essential + sufficient context for code analysis (~800 bytes per error)",
+    "full": "Complete details including full traceback (~2000+ bytes per error)",
+}
+
+RESOURCE_FEATURES = (
+    "Mode-specific caching with separate cache keys",
+    "Response optimization based on mode setting",
+    "Backward compatibility with default balanced mode",
+    "Graceful error handling with mode information",
+    "SQLite-based caching with TTL management",
+    "Integration with existing tools system",
+    "Comprehensive metadata and resource URIs",
+)
+
+IMPLEMENTATION_STATUS = {
+    "Pipeline Resources": "✅ Complete",
+    "Job Resources": "✅ Complete",
+    "File Resources": "✅ Complete with mode parameters",
+    "Error Resources": "✅ Complete with mode parameters",
+    "Analysis Resources": "✅ Complete with mode parameters",
+    "Cache System": "✅ Complete with SQLite",
+    "Investigation Prompts": "✅ Complete",
+    "Server Integration": "✅ Complete",
+}
+
+NEXT_STEPS = (
+    "Add comprehensive unit tests for all resources",
+    "Create usage documentation and examples",
+    "Add performance monitoring and metrics",
+    "Implement resource discovery mechanisms",
+    "Add response validation and schema checking",
+    "Create CLI tools for resource testing",
+)
+
+# The report is static, so it is rendered once when the module is loaded
+RESOURCE_OVERVIEW = "\n".join(
+    [
+        "\n📋 Resource URI Patterns:",
+        "1. Pipeline Resources:",
+        "   - gl://pipeline/{project_id}/{pipeline_id}",
+        "   - gl://pipeline/{project_id}/{pipeline_id}?mode={mode}",
+        "\n2. Job Resources:",
+        "   - gl://job/{project_id}/{job_id}",
+        "   - gl://job/{project_id}/{job_id}?mode={mode}",
+        "\n3. File Resources:",
+        "   - gl://file/{project_id}/{job_id}/{file_path}",
+        "   - gl://file/{project_id}/{job_id}/{file_path}?mode={mode}",
+        "\n4. Error Resources:",
+        "   - gl://error/{project_id}/{job_id}",
+        "   - gl://error/{project_id}/{job_id}?mode={mode}",
+        "\n5. Analysis Resources:",
+        "   - gl://analysis/{project_id}",
+        "   - gl://analysis/{project_id}?mode={mode}",
+        "   - gl://analysis/{project_id}/pipeline/{pipeline_id}",
+        "   - gl://analysis/{project_id}/pipeline/{pipeline_id}?mode={mode}",
+        "   - gl://analysis/{project_id}/job/{job_id}",
+        "   - gl://analysis/{project_id}/job/{job_id}?mode={mode}",
+        "\n🎛️ Available Response Modes:",
+        *(f"   - {mode:8}: {desc}" for mode, desc in MODE_DESCRIPTIONS.items()),
+        "\n🔧 Resource Features:",
+        *(f"   ✓ {feature}" for feature in RESOURCE_FEATURES),
+        "\n🏗️ Architecture Overview:",
+        "   📦 Cache Layer: SQLite with async operations, TTL, and cleanup",
+        "   🔄 Resource Layer: FastMCP resources with mode parameter support",
+        "   🎯 Optimization Layer: Response mode optimization system",
+        "   🛠️ Tools Integration: Shared utilities and GitLab analyzer",
+        "\n📊 Implementation Status:",
+        *(
+            f"   {status} {component}"
+            for component, status in IMPLEMENTATION_STATUS.items()
+        ),
+        "\n🎯 Next Available Steps:",
+        *(f"   {i}. {step}" for i, step in enumerate(NEXT_STEPS, 1)),
+        "\n🚀 Resource System Ready!",
+        "All resources are implemented with mode parameter support and ready for use.",
+    ]
+)
+
+MODE_USAGE = "\n".join(
+    [
+        "\n💡 Mode Usage Examples:",
+        "\n🤖 Agent Workflows:",
+        "   Minimal Mode: Fast iteration over many files/errors",
+        "   └─ gl://file/123/456/test.py?mode=minimal",
+        "\n🔍 Analysis Tasks:",
+        "   Balanced Mode: General analysis and error investigation",
+        "   └─ gl://error/123/456?mode=balanced",
+        "\n🛠️ Code Fixing:",
+        "   Fixing Mode: AI-powered code analysis and automated fixing",
+        "   └─ gl://analysis/123/job/456?mode=fixing",
+        "\n📋 Complete Investigation:",
+        "   Full Mode: Complete details for complex debugging",
+        "   └─ gl://analysis/123/pipeline/789?mode=full",
+    ]
+)
+
 
 async def test_all_resources():
     """Test all resource types with mode parameters"""
     print("Testing MCP Resources with Mode Parameters")
-    print("=" * 60)
+    print(SEPARATOR)
 
     try:
         # Create server to test resource registration
         create_server()
         print("✓ Server created successfully with all resources registered")
-
-        # Test resource URI patterns
-        print("\n📋 Resource URI Patterns:")
-        print("1. Pipeline Resources:")
-        print("   - gl://pipeline/{project_id}/{pipeline_id}")
-        print("   - gl://pipeline/{project_id}/{pipeline_id}?mode={mode}")
-
-        print("\n2. Job Resources:")
-        print("   - gl://job/{project_id}/{job_id}")
-        print("   - gl://job/{project_id}/{job_id}?mode={mode}")
-
-        print("\n3. File Resources:")
-        print("   - gl://file/{project_id}/{job_id}/{file_path}")
-        print("   - gl://file/{project_id}/{job_id}/{file_path}?mode={mode}")
-
-        print("\n4. Error Resources:")
-        print("   - gl://error/{project_id}/{job_id}")
-        print("   - gl://error/{project_id}/{job_id}?mode={mode}")
-
-        print("\n5. Analysis Resources:")
-        print("   - gl://analysis/{project_id}")
-        print("   - gl://analysis/{project_id}?mode={mode}")
-        print("   - gl://analysis/{project_id}/pipeline/{pipeline_id}")
-        print("   - gl://analysis/{project_id}/pipeline/{pipeline_id}?mode={mode}")
-        print("   - gl://analysis/{project_id}/job/{job_id}")
-        print("   - gl://analysis/{project_id}/job/{job_id}?mode={mode}")
-
-        print("\n🎛️ Available Response Modes:")
-        modes = ["minimal", "balanced", "fixing", "full"]
-        mode_descriptions = {
-            "minimal": "Essential info only (~200 bytes per error)",
-            "balanced": "Essential + limited context (~500 bytes per error) [DEFAULT]",
-            "fixing": "Essential + sufficient context for code analysis (~800 bytes per error)",
-            "full": "Complete details including full traceback (~2000+ bytes per error)",
-        }
-
-        for mode in modes:
-            print(f"   - {mode:8}: {mode_descriptions[mode]}")
-
-        print("\n🔧 Resource Features:")
-        features = [
-            "Mode-specific caching with separate cache keys",
-            "Response optimization based on mode setting",
-            "Backward compatibility with default balanced mode",
-            "Graceful error handling with mode information",
-            "SQLite-based caching with TTL management",
-            "Integration with existing tools system",
-            "Comprehensive metadata and resource URIs",
-        ]
-
-        for feature in features:
-            print(f"   ✓ {feature}")
-
-        print("\n🏗️ Architecture Overview:")
-        print("   📦 Cache Layer: SQLite with async operations, TTL, and cleanup")
-        print("   🔄 Resource Layer: FastMCP resources with mode parameter support")
-        print("   🎯 Optimization Layer: Response mode optimization system")
-        print("   🛠️ Tools Integration: Shared utilities and GitLab analyzer")
-
-        print("\n📊 Implementation Status:")
-        implementations = {
-            "Pipeline Resources": "✅ Complete",
-            "Job Resources": "✅ Complete",
-            "File Resources": "✅ Complete with mode parameters",
-            "Error Resources": "✅ Complete with mode parameters",
-            "Analysis Resources": "✅ Complete with mode parameters",
-            "Cache System": "✅ Complete with SQLite",
-            "Investigation Prompts": "✅ Complete",
-            "Server Integration": "✅ Complete",
-        }
-
-        for component, status in implementations.items():
-            print(f"   {status} {component}")
-
-        print("\n🎯 Next Available Steps:")
-        next_steps = [
-            "Add comprehensive unit tests for all resources",
-            "Create usage documentation and examples",
-            "Add performance monitoring and metrics",
-            "Implement resource discovery mechanisms",
-            "Add response validation and schema checking",
-            "Create CLI tools for resource testing",
-        ]
-
-        for i, step in enumerate(next_steps, 1):
-            print(f"   {i}. {step}")
-
-        print("\n🚀 Resource System Ready!")
-        print(
-            "All resources are implemented with mode parameter support and ready for use."
-        )
+        print(RESOURCE_OVERVIEW)
 
         return True
 
@@ -125,22 +138,7 @@ async def test_all_resources():
 
 async def demonstrate_mode_usage():
     """Demonstrate how different modes would be used"""
-    print("\n💡 Mode Usage Examples:")
-    print("\n🤖 Agent Workflows:")
-    print("   Minimal Mode: Fast iteration over many files/errors")
-    print("   └─ gl://file/123/456/test.py?mode=minimal")
-
-    print("\n🔍 Analysis Tasks:")
-    print("   Balanced Mode: General analysis and error investigation")
-    print("   └─ gl://error/123/456?mode=balanced")
-
-    print("\n🛠️ Code Fixing:")
-    print("   Fixing Mode: AI-powered code analysis and automated fixing")
-    print("   └─ gl://analysis/123/job/456?mode=fixing")
-
-    print("\n📋 Complete Investigation:")
-    print("   Full Mode: Complete details for complex debugging")
-    print("   └─ gl://analysis/123/pipeline/789?mode=full")
+    print(MODE_USAGE)
 
 
 if __name__ == "__main__":
@@ -151,10 +149,10 @@ if __name__ == "__main__":
     asyncio.run(demonstrate_mode_usage())
 
     if success:
-        print("\n" + "=" * 60)
+        print("\n" + SEPARATOR)
         print("🎉 ALL RESOURCES SUCCESSFULLY IMPLEMENTED!")
         print("🎯 The MCP server now provides comprehensive GitLab analysis resources")
         print("⚡ with flexible mode parameters for optimal agent consumption")
-        print("=" * 60)
+        print(SEPARATOR)
     else:
         print("\n❌ Some issues were found during testing")
@@ -26,34 +26,194 @@ Licensed under the MIT License
 
 import argparse
 import asyncio
+import hashlib
 import json
+import logging
 import os
 import sys
+import time
+from contextlib import AsyncExitStack
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-try:
-    from dotenv import load_dotenv
+from gitlab_analyzer.utils.tool_calls import TOOL_CALL_TIMEOUT, json_loads, safe_call
 
-    load_dotenv()  # Load .env file if available
+# orjson also serializes the --json output when it is installed
+try:
+    import orjson
 except ImportError:
-    pass  # python-dotenv not installed, use environment variables directly
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Divider printed above raw trace output
+SEPARATOR = "=" * 60
+
+# Job status markers; any other status is shown as 🟡
+_STATUS_EMOJI = {"failed": "❌", "success": "✅"}
+
+# Tool results are cached here for CACHE_TTL seconds unless --no-cache is given
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "gitlab-pipeline-analyzer"
+)
+CACHE_TTL = 300
+
+# Pipeline states after which status and analysis results no longer change
+FINISHED_STATUSES = frozenset({"success", "failed", "canceled", "skipped"})
+
+
+def _is_cacheable(name: str, result: Any) -> bool:
+    """Whether a tool result is final and safe to reuse on later runs"""
+    if not isinstance(result, dict) or "error" in result:
+        return False
+    # Traces are not cached: the tool result does not say whether the job has
+    # finished, and a running job's trace is still growing
+    if name == "get_pipeline_status":
+        return result.get("status") in FINISHED_STATUSES
+    if name == "analyze_failed_pipeline":
+        return result.get("pipeline_status") in FINISHED_STATUSES
+    return False
+
+
+class ResultCache:
+    """On-disk cache of tool results with one JSON file per call"""
+
+    def __init__(self, directory: Path = CACHE_DIR, ttl: float = CACHE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, name: str, arguments: dict[str, Any]) -> Path:
+        """File holding the result of a call against the configured GitLab"""
+        # Results depend on what the token may see, so never share them
+        # between tokens; only a fingerprint of the token goes into the key
+        token_fingerprint = hashlib.sha256(
+            os.environ.get("GITLAB_TOKEN", "").encode()
+        ).hexdigest()
+        key = json.dumps(
+            [os.environ.get("GITLAB_URL", ""), token_fingerprint, name, arguments],
+            sort_keys=True,
+        )
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Return the cached result, or None when missing or expired"""
+        path = self._path(name, arguments)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, name: str, arguments: dict[str, Any], result: Any) -> None:
+        """Store a result; failures to write are ignored"""
+        path = self._path(name, arguments)
+        try:
+            payload = json.dumps(result).encode("utf-8")
+            # Results may contain private project data, so keep them owner-only
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+def _print_json(data: Any) -> None:
+    """Print data as indented JSON, serializing with orjson when available"""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:  # orjson.JSONEncodeError for unsupported types
+            pass
+        else:
+            # Flush pending text so the raw bytes land in order
+            sys.stdout.flush()
+            sys.stdout.buffer.write(payload + b"\n")
+            sys.stdout.buffer.flush()
+            return
+    print(json.dumps(data, indent=2, ensure_ascii=False))
 
-from fastmcp import Client
+
+@lru_cache(maxsize=1)
+def _validate_environment() -> None:
+    """Validate required environment variables once per process"""
+    env = {var: os.environ.get(var, "") for var in ("GITLAB_URL", "GITLAB_TOKEN")}
+    missing_vars = [var for var, value in env.items() if not value]
+
+    if missing_vars:
+        print(f"❌ Missing required environment variables: {', '.join(missing_vars)}")
+        print("Please set them before running this script.")
+        sys.exit(1)
+
+    logger.info("✅ Environment validated")
+    logger.info("   GitLab URL: %s", env["GITLAB_URL"])
+    logger.info("   Token: %s...%s", "*" * 8, env["GITLAB_TOKEN"][-4:])
 
 
 class JobResultAnalyzer:
     """GitLab Job Result Analyzer using FastMCP client"""
 
-    def __init__(self, server_script: str = "server.py"):
+    def __init__(
+        self,
+        server_script: str = "server.py",
+        use_cache: bool = True,
+        tool_timeout: float = TOOL_CALL_TIMEOUT,
+    ):
         """
         Initialize the analyzer with MCP server script path
 
         Args:
             server_script: Path to the MCP server script
+            use_cache: Reuse final tool results stored on disk by earlier runs
+            tool_timeout: Seconds to wait for a single tool call, 0 for no limit
         """
         self.server_script = server_script
-        self._validate_environment()
+        self.tool_timeout = tool_timeout
+        self._cache = ResultCache() if use_cache else None
+        self._mcp_client = None
+        self._stack: AsyncExitStack | None = None
+        _validate_environment()
+
+    async def __aenter__(self) -> "JobResultAnalyzer":
+        """Open one server session shared by every tool call in the block"""
+        self._stack = AsyncExitStack()
+        await self._stack.enter_async_context(self._client())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the shared server session"""
+        if self._stack is not None:
+            await self._stack.aclose()
+            self._stack = None
+
+    def _client(self):
+        """
+        FastMCP client for the server script, created once per analyzer
+
+        The client is reentrant, so calls made inside ``async with analyzer:``
+        reuse the session opened on entry instead of spawning the server and
+        repeating the handshake for every tool call.
+        """
+        if self._mcp_client is None:
+            from fastmcp import Client
+
+            self._mcp_client = Client(self.server_script)
+        return self._mcp_client
+
+    @staticmethod
+    def _tool_arguments(project_id: str | int, **ids: int) -> dict[str, Any]:
+        """Build tool arguments, converting project_id to str only when needed"""
+        if not isinstance(project_id, str):
+            project_id = str(project_id)
+        return {"project_id": project_id, **ids}
 
     def _extract_result(self, mcp_result):
         """Extract the actual result from FastMCP CallToolResult"""
@@ -61,36 +221,39 @@ class JobResultAnalyzer:
         if isinstance(mcp_result, dict):
             return mcp_result
 
-        if hasattr(mcp_result, "content") and mcp_result.content:
-            # FastMCP returns content as a list of TextContent objects
-            content = mcp_result.content[0]
-
-            if hasattr(content, "text"):
-                import json
-
-                try:
-                    return json.loads(content.text)
-                except json.JSONDecodeError:
-                    return {"error": f"Invalid JSON response: {content.text}"}
-
-        # Fallback: return empty dict with error if we can't handle it
-        return {"error": f"Unexpected result format: {type(mcp_result)}"}
+        # Structured tool output is already decoded by the client
+        structured = getattr(mcp_result, "structured_content", None)
+        if structured is not None:
+            return structured
 
-    def _validate_environment(self):
-        """Validate required environment variables"""
-        required_vars = ["GITLAB_URL", "GITLAB_TOKEN"]
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        # FastMCP returns content as a list of TextContent objects
+        try:
+            text = mcp_result.content[0].text
+        except (AttributeError, IndexError, TypeError):
+            # Fallback: return empty dict with error if we can't handle it
+            return {"error": f"Unexpected result format: {type(mcp_result)}"}
 
-        if missing_vars:
-            print(
-                f"❌ Missing required environment variables: {', '.join(missing_vars)}"
+        try:
+            return json_loads(text)
+        except ValueError:  # JSONDecodeError of every decoder subclasses it
+            return {"error": f"Invalid JSON response: {text}"}
+
+    async def _call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Call an MCP tool, serving final results from the on-disk cache"""
+        if self._cache is not None:
+            cached = self._cache.get(name, arguments)
+            if cached is not None:
+                return cached
+
+        client = self._client()
+        async with client:
+            result = self._extract_result(
+                await safe_call(client, name, arguments, self.tool_timeout)
             )
-            print("Please set them before running this script.")
-            sys.exit(1)
 
-        print("✅ Environment validated")
-        print(f"   GitLab URL: {os.getenv('GITLAB_URL')}")
-        print(f"   Token: {'*' * 8}...{os.getenv('GITLAB_TOKEN', '')[-4:]}")
+        if self._cache is not None and _is_cacheable(name, result):
+            self._cache.set(name, arguments, result)
+        return result
 
     async def get_single_job_result(self, project_id: str | int, job_id: int) -> Any:
         """
@@ -103,14 +266,11 @@ class JobResultAnalyzer:
         Returns:
             Job analysis result including errors and warnings
         """
-        print(f"🔍 Analyzing single job {job_id} in project {project_id}...")
+        logger.info("🔍 Analyzing single job %s in project %s...", job_id, project_id)
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "analyze_single_job", {"project_id": str(project_id), "job_id": job_id}
-            )
-            return self._extract_result(result)
+        return await self._call_tool(
+            "analyze_single_job", self._tool_arguments(project_id, job_id=job_id)
+        )
 
     async def get_job_trace(self, project_id: str | int, job_id: int) -> Any:
         """
@@ -123,14 +283,11 @@ class JobResultAnalyzer:
         Returns:
             Job trace log
         """
-        print(f"📋 Getting trace for job {job_id} in project {project_id}...")
+        logger.info("📋 Getting trace for job %s in project %s...", job_id, project_id)
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "get_job_trace", {"project_id": str(project_id), "job_id": job_id}
-            )
-            return self._extract_result(result)
+        return await self._call_tool(
+            "get_job_trace", self._tool_arguments(project_id, job_id=job_id)
+        )
 
     async def get_pipeline_jobs(self, project_id: str | int, pipeline_id: int) -> Any:
         """
@@ -143,17 +300,16 @@ class JobResultAnalyzer:
         Returns:
             All pipeline jobs with their status
         """
-        print(
-            f"📊 Getting all jobs for pipeline {pipeline_id} in project {project_id}..."
+        logger.info(
+            "📊 Getting all jobs for pipeline %s in project %s...",
+            pipeline_id,
+            project_id,
         )
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "get_pipeline_jobs",
-                {"project_id": str(project_id), "pipeline_id": pipeline_id},
-            )
-            return self._extract_result(result)
+        return await self._call_tool(
+            "get_pipeline_jobs",
+            self._tool_arguments(project_id, pipeline_id=pipeline_id),
+        )
 
     async def get_failed_jobs(self, project_id: str | int, pipeline_id: int) -> Any:
         """
@@ -166,17 +322,15 @@ class JobResultAnalyzer:
         Returns:
             Failed pipeline jobs
         """
-        print(
-            f"❌ Getting failed jobs for pipeline {pipeline_id} in project {project_id}..."
+        logger.info(
+            "❌ Getting failed jobs for pipeline %s in project %s...",
+            pipeline_id,
+            project_id,
         )
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "get_failed_jobs",
-                {"project_id": str(project_id), "pipeline_id": pipeline_id},
-            )
-            return self._extract_result(result)
+        return await self._call_tool(
+            "get_failed_jobs", self._tool_arguments(project_id, pipeline_id=pipeline_id)
+        )
 
     async def analyze_failed_pipeline(
         self, project_id: str | int, pipeline_id: int
@@ -191,15 +345,14 @@ class JobResultAnalyzer:
         Returns:
             Complete pipeline analysis with errors and warnings
         """
-        print(f"🔥 Analyzing failed pipeline {pipeline_id} in project {project_id}...")
+        logger.info(
+            "🔥 Analyzing failed pipeline %s in project %s...", pipeline_id, project_id
+        )
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "analyze_failed_pipeline",
-                {"project_id": str(project_id), "pipeline_id": pipeline_id},
-            )
-            return self._extract_result(result)
+        return await self._call_tool(
+            "analyze_failed_pipeline",
+            self._tool_arguments(project_id, pipeline_id=pipeline_id),
+        )
 
     async def get_pipeline_status(self, project_id: str | int, pipeline_id: int) -> Any:
         """
@@ -212,17 +365,38 @@ class JobResultAnalyzer:
         Returns:
             Pipeline status information
         """
-        print(
-            f"ℹ️  Getting status for pipeline {pipeline_id} in project {project_id}..."
+        logger.info(
+            "ℹ️  Getting status for pipeline %s in project %s...",
+            pipeline_id,
+            project_id,
         )
 
-        client = Client(self.server_script)
-        async with client:
-            result = await client.call_tool(
-                "get_pipeline_status",
-                {"project_id": str(project_id), "pipeline_id": pipeline_id},
+        return await self._call_tool(
+            "get_pipeline_status",
+            self._tool_arguments(project_id, pipeline_id=pipeline_id),
+        )
+
+    async def analyze_pipeline_bundle(
+        self, project_id: str | int, pipeline_id: int
+    ) -> dict[str, Any]:
+        """
+        Get pipeline status, failed jobs and failure analysis concurrently
+
+        Args:
+            project_id: GitLab project ID or path
+            pipeline_id: GitLab pipeline ID
+
+        Returns:
+            Dict with "status", "failed_jobs" and "analysis" results
+        """
+        keys = ("status", "failed_jobs", "analysis")
+        async with self._client():
+            results = await asyncio.gather(
+                self.get_pipeline_status(project_id, pipeline_id),
+                self.get_failed_jobs(project_id, pipeline_id),
+                self.analyze_failed_pipeline(project_id, pipeline_id),
             )
-            return self._extract_result(result)
+        return dict(zip(keys, results, strict=True))
 
     def print_job_summary(self, result: Any):
         """Print a formatted summary of job analysis"""
@@ -230,33 +404,80 @@ class JobResultAnalyzer:
             print(f"❌ Error: {result['error']}")
             return
 
-        if "analysis" in result:
-            analysis = result["analysis"]
-            summary = result.get("summary", {})
-
-            print("\n📊 Job Analysis Summary")
-            print(f"   Job ID: {result.get('job_id')}")
-            print(f"   Job URL: {result.get('job_url', 'N/A')}")
-            print(f"   Errors: {summary.get('total_errors', 0)}")
-            print(f"   Warnings: {summary.get('total_warnings', 0)}")
-            print(f"   Log entries: {summary.get('total_log_entries', 0)}")
-            print(f"   Has trace: {summary.get('has_trace', False)}")
-
-            if analysis.get("errors"):
-                print("\n🔴 Errors found:")
-                for i, error in enumerate(analysis["errors"][:5], 1):  # Show first 5
-                    print(f"   {i}. {error.get('message', 'No message')}")
-                if len(analysis["errors"]) > 5:
-                    print(f"   ... and {len(analysis['errors']) - 5} more errors")
-
-            if analysis.get("warnings"):
-                print("\n🟡 Warnings found:")
-                for i, warning in enumerate(
-                    analysis["warnings"][:3], 1
-                ):  # Show first 3
-                    print(f"   {i}. {warning.get('message', 'No message')}")
-                if len(analysis["warnings"]) > 3:
-                    print(f"   ... and {len(analysis['warnings']) - 3} more warnings")
+        if "analysis" not in result:
+            return
+
+        analysis = result["analysis"]
+        summary = result.get("summary", {})
+        lines = [
+            "\n📊 Job Analysis Summary",
+            f"   Job ID: {result.get('job_id')}",
+            f"   Job URL: {result.get('job_url', 'N/A')}",
+            f"   Errors: {summary.get('total_errors', 0)}",
+            f"   Warnings: {summary.get('total_warnings', 0)}",
+            f"   Log entries: {summary.get('total_log_entries', 0)}",
+            f"   Has trace: {summary.get('has_trace', False)}",
+        ]
+
+        errors = analysis.get("errors")
+        if errors:
+            lines.append("\n🔴 Errors found:")
+            lines.extend(  # Show first 5
+                f"   {i}. {error.get('message', 'No message')}"
+                for i, error in enumerate(islice(errors, 5), 1)
+            )
+            hidden_errors = len(errors) - 5
+            if hidden_errors > 0:
+                lines.append(f"   ... and {hidden_errors} more errors")
+
+        warnings = analysis.get("warnings")
+        if warnings:
+            lines.append("\n🟡 Warnings found:")
+            lines.extend(  # Show first 3
+                f"   {i}. {warning.get('message', 'No message')}"
+                for i, warning in enumerate(islice(warnings, 3), 1)
+            )
+            hidden_warnings = len(warnings) - 3
+            if hidden_warnings > 0:
+                lines.append(f"   ... and {hidden_warnings} more warnings")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def print_jobs_summary(self, result: Any, failed_only: bool = False):
+        """Print a formatted list of pipeline jobs"""
+        if "error" in result:
+            print(f"❌ Error: {result['error']}")
+            return
+
+        jobs = result.get("failed_jobs" if failed_only else "jobs", [])
+        lines = [
+            f"\n📊 {'Failed ' if failed_only else ''}Jobs Summary",
+            f"   Total: {len(jobs)}",
+        ]
+        for job in jobs:
+            status_emoji = _STATUS_EMOJI.get(job["status"], "🟡")
+            lines.append(
+                f"   {status_emoji} {job['name']} (Stage: {job['stage']}, Status: {job['status']})"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def print_pipeline_status(self, result: Any):
+        """Print a formatted summary of pipeline status"""
+        if "error" in result:
+            print(f"❌ Error: {result['error']}")
+            return
+
+        lines = [
+            "\nℹ️  Pipeline Status",
+            f"   ID: {result.get('pipeline_id')}",
+            f"   Status: {result.get('status')}",
+            f"   Ref: {result.get('ref')}",
+            f"   SHA: {result.get('sha')}",
+            f"   Created: {result.get('created_at')}",
+            f"   Updated: {result.get('updated_at')}",
+            f"   URL: {result.get('web_url')}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_pipeline_summary(self, result: Any):
         """Print a formatted summary of pipeline analysis"""
@@ -265,90 +486,90 @@ class JobResultAnalyzer:
             return
 
         summary = result.get("summary", {})
-        print("\n📊 Pipeline Analysis Summary")
-        print(f"   Pipeline ID: {result.get('pipeline_id')}")
-        print(f"   Status: {result.get('pipeline_status')}")
-        print(f"   Failed jobs: {summary.get('failed_jobs_count', 0)}")
-        print(f"   Total errors: {summary.get('total_errors', 0)}")
-        print(f"   Total warnings: {summary.get('total_warnings', 0)}")
+        lines = [
+            "\n📊 Pipeline Analysis Summary",
+            f"   Pipeline ID: {result.get('pipeline_id')}",
+            f"   Status: {result.get('pipeline_status')}",
+            f"   Failed jobs: {summary.get('failed_jobs_count', 0)}",
+            f"   Total errors: {summary.get('total_errors', 0)}",
+            f"   Total warnings: {summary.get('total_warnings', 0)}",
+        ]
 
         if summary.get("failed_stages"):
-            print(f"   Failed stages: {', '.join(summary['failed_stages'])}")
+            lines.append(f"   Failed stages: {', '.join(summary['failed_stages'])}")
 
         if result.get("failed_jobs"):
-            print("\n❌ Failed Jobs:")
-            for job in result["failed_jobs"]:
-                print(
-                    f"   • {job['name']} (Stage: {job['stage']}, Reason: {job.get('failure_reason', 'Unknown')})"
-                )
+            lines.append("\n❌ Failed Jobs:")
+            lines.extend(
+                f"   • {job['name']} (Stage: {job['stage']}, Reason: {job.get('failure_reason', 'Unknown')})"
+                for job in result["failed_jobs"]
+            )
 
         # Show detailed errors if available
         analysis = result.get("analysis", {})
         if analysis:
-            print("\n🔥 Detailed Errors by Job:")
+            lines.append("\n🔥 Detailed Errors by Job:")
             for job_name, job_analysis in analysis.items():
                 if isinstance(job_analysis, list) and job_analysis:
-                    print(f"\n   📋 Job: {job_name}")
-
-                    # Show first few errors
-                    errors = [
-                        entry for entry in job_analysis if entry.get("level") == "error"
-                    ]
-                    warnings = [
-                        entry
-                        for entry in job_analysis
-                        if entry.get("level") == "warning"
-                    ]
+                    lines.append(f"\n   📋 Job: {job_name}")
+
+                    # Split entries by level in a single pass
+                    errors = []
+                    warnings = []
+                    for entry in job_analysis:
+                        level = entry.get("level")
+                        if level == "error":
+                            errors.append(entry)
+                        elif level == "warning":
+                            warnings.append(entry)
 
                     if errors:
-                        print("      🔴 Errors:")
-                        for i, error in enumerate(errors[:5], 1):  # Show up to 5 errors
-                            message = error.get("message", "").strip()
-                            context = error.get("context", "").strip()
-                            line_num = error.get("line_number")
-
-                            print(f"         {i}. {message}")
-                            if line_num:
-                                print(f"            📍 Line {line_num}")
-                            if context:
-                                # Show relevant context lines
-                                context_lines = context.split("\n")[
-                                    max(0, len(context.split("\n")) // 2 - 1) :
-                                ]
-                                for ctx_line in context_lines[
-                                    :3
-                                ]:  # Show up to 3 context lines
-                                    if ctx_line.strip() and ctx_line.strip() != message:
-                                        print(f"            💬 {ctx_line.strip()}")
-                            print()  # Empty line between errors
-                        if len(errors) > 5:
-                            print(f"         ... and {len(errors) - 5} more errors")
+                        lines.append("      🔴 Errors:")
+                        for i, error in enumerate(
+                            islice(errors, 5), 1
+                        ):  # Show up to 5 errors
+                            self._append_entry(lines, i, error, 3)
+                        hidden_errors = len(errors) - 5
+                        if hidden_errors > 0:
+                            lines.append(
+                                f"         ... and {hidden_errors} more errors"
+                            )
 
                     if warnings:
-                        print("      🟡 Warnings:")
+                        lines.append("      🟡 Warnings:")
                         for i, warning in enumerate(
-                            warnings[:3], 1
+                            islice(warnings, 3), 1
                         ):  # Show up to 3 warnings
-                            message = warning.get("message", "").strip()
-                            context = warning.get("context", "").strip()
-                            line_num = warning.get("line_number")
-
-                            print(f"         {i}. {message}")
-                            if line_num:
-                                print(f"            📍 Line {line_num}")
-                            if context:
-                                # Show relevant context lines
-                                context_lines = context.split("\n")[
-                                    max(0, len(context.split("\n")) // 2 - 1) :
-                                ]
-                                for ctx_line in context_lines[
-                                    :2
-                                ]:  # Show up to 2 context lines
-                                    if ctx_line.strip() and ctx_line.strip() != message:
-                                        print(f"            💬 {ctx_line.strip()}")
-                            print()  # Empty line between warnings
-                        if len(warnings) > 3:
-                            print(f"         ... and {len(warnings) - 3} more warnings")
+                            self._append_entry(lines, i, warning, 2)
+                        hidden_warnings = len(warnings) - 3
+                        if hidden_warnings > 0:
+                            lines.append(
+                                f"         ... and {hidden_warnings} more warnings"
+                            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _append_entry(
+        lines: list[str], index: int, entry: dict[str, Any], max_context: int
+    ) -> None:
+        """Append one error or warning with up to max_context context lines"""
+        message = entry.get("message", "").strip()
+        context = entry.get("context", "").strip()
+        line_num = entry.get("line_number")
+
+        lines.append(f"         {index}. {message}")
+        if line_num:
+            lines.append(f"            📍 Line {line_num}")
+        if context:
+            # Show relevant context lines
+            context_lines = context.split("\n")
+            start = max(0, len(context_lines) // 2 - 1)
+            for ctx_line in islice(context_lines, start, start + max_context):
+                stripped = ctx_line.strip()
+                if stripped and stripped != message:
+                    lines.append(f"            💬 {stripped}")
+        lines.append("")  # Empty line between entries
 
 
 def main():
@@ -400,7 +621,7 @@ Examples:
     parser.add_argument(
         "--analyze-failures",
         action="store_true",
-        help="Analyze failed pipeline with full error extraction (requires --pipeline-id)",
+        help="Analyze failed pipeline with status, failed jobs and full error extraction (requires --pipeline-id)",
     )
 
     parser.add_argument(
@@ -424,6 +645,22 @@ Examples:
     # Output options
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the server instead of reusing cached results",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=TOOL_CALL_TIMEOUT,
+        help=(
+            "Seconds to wait for each tool call, 0 for no limit "
+            f"(default: {TOOL_CALL_TIMEOUT:g}, or MCP_TOOL_TIMEOUT)"
+        ),
+    )
+
     parser.add_argument(
         "--server-script",
         type=str,
@@ -433,6 +670,14 @@ Examples:
 
     args = parser.parse_args()
 
+    # Progress messages go to stdout as before, but stay quiet with --json so
+    # the output can be piped into other tools
+    logging.basicConfig(
+        level=logging.WARNING if args.json else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
     # Validate argument combinations
     if args.job_id and args.pipeline_id:
         parser.error("Cannot specify both --job-id and --pipeline-id")
@@ -452,9 +697,10 @@ Examples:
     if any(pipeline_flags) and not args.pipeline_id:
         parser.error("Pipeline-specific flags require --pipeline-id")
 
-    # Check if server script exists
-    server_path = Path(args.server_script)
-    if not server_path.exists():
+    # Check if server script exists, resolving it to an absolute path once
+    try:
+        server_path = Path(args.server_script).resolve(strict=True)
+    except FileNotFoundError:
         print(f"❌ MCP server script not found: {args.server_script}")
         print(f"   Current directory: {Path.cwd()}")
         print(
@@ -462,47 +708,60 @@ Examples:
         )
         sys.exit(1)
 
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()  # Load .env file if available
+    except ImportError:
+        pass  # python-dotenv not installed, use environment variables directly
+
     # Initialize analyzer
-    analyzer = JobResultAnalyzer(args.server_script)
+    analyzer = JobResultAnalyzer(
+        str(server_path), use_cache=not args.no_cache, tool_timeout=args.timeout
+    )
 
     async def run_analysis():
         try:
             result = None
 
-            if args.job_id:
-                if args.trace_only:
-                    result = await analyzer.get_job_trace(args.project_id, args.job_id)
-                else:
-                    result = await analyzer.get_single_job_result(
-                        args.project_id, args.job_id
-                    )
-
-            elif args.pipeline_id:
-                if args.analyze_failures:
-                    result = await analyzer.analyze_failed_pipeline(
-                        args.project_id, args.pipeline_id
-                    )
-                elif args.all_jobs:
-                    result = await analyzer.get_pipeline_jobs(
-                        args.project_id, args.pipeline_id
-                    )
-                elif args.failed_jobs_only:
-                    result = await analyzer.get_failed_jobs(
-                        args.project_id, args.pipeline_id
-                    )
-                elif args.status_only:
-                    result = await analyzer.get_pipeline_status(
-                        args.project_id, args.pipeline_id
-                    )
-                else:
-                    # Default: analyze failed pipeline
-                    result = await analyzer.analyze_failed_pipeline(
-                        args.project_id, args.pipeline_id
-                    )
+            # One server session serves every tool call of this run
+            async with analyzer:
+                if args.job_id:
+                    if args.trace_only:
+                        result = await analyzer.get_job_trace(
+                            args.project_id, args.job_id
+                        )
+                    else:
+                        result = await analyzer.get_single_job_result(
+                            args.project_id, args.job_id
+                        )
+
+                elif args.pipeline_id:
+                    if args.analyze_failures:
+                        result = await analyzer.analyze_pipeline_bundle(
+                            args.project_id, args.pipeline_id
+                        )
+                    elif args.all_jobs:
+                        result = await analyzer.get_pipeline_jobs(
+                            args.project_id, args.pipeline_id
+                        )
+                    elif args.failed_jobs_only:
+                        result = await analyzer.get_failed_jobs(
+                            args.project_id, args.pipeline_id
+                        )
+                    elif args.status_only:
+                        result = await analyzer.get_pipeline_status(
+                            args.project_id, args.pipeline_id
+                        )
+                    else:
+                        # Default: analyze failed pipeline
+                        result = await analyzer.analyze_failed_pipeline(
+                            args.project_id, args.pipeline_id
+                        )
 
             # Output results
             if args.json:
-                print(json.dumps(result, indent=2, ensure_ascii=False))
+                _print_json(result)
             else:
                 if args.job_id:
                     if args.trace_only:
@@ -512,59 +771,41 @@ Examples:
                             print(
                                 f"📋 Job Trace (Length: {result.get('trace_length', 0)} chars)"
                             )
-                            print(f"{'=' * 60}")
+                            print(SEPARATOR)
                             print(result.get("trace", "No trace available"))
                     else:
                         analyzer.print_job_summary(result)
                 elif args.pipeline_id:
                     if args.all_jobs or args.failed_jobs_only:
-                        if "error" in result:
-                            print(f"❌ Error: {result['error']}")
-                        else:
-                            jobs_key = (
-                                "failed_jobs" if args.failed_jobs_only else "jobs"
-                            )
-                            jobs = result.get(jobs_key, [])
-                            print(
-                                f"\n📊 {'Failed ' if args.failed_jobs_only else ''}Jobs Summary"
-                            )
-                            print(f"   Total: {len(jobs)}")
-                            for job in jobs:
-                                status_emoji = (
-                                    "❌"
-                                    if job["status"] == "failed"
-                                    else "✅"
-                                    if job["status"] == "success"
-                                    else "🟡"
-                                )
-                                print(
-                                    f"   {status_emoji} {job['name']} (Stage: {job['stage']}, Status: {job['status']})"
-                                )
+                        analyzer.print_jobs_summary(
+                            result, failed_only=args.failed_jobs_only
+                        )
                     elif args.status_only:
-                        if "error" in result:
-                            print(f"❌ Error: {result['error']}")
-                        else:
-                            print("\nℹ️  Pipeline Status")
-                            print(f"   ID: {result.get('pipeline_id')}")
-                            print(f"   Status: {result.get('status')}")
-                            print(f"   Ref: {result.get('ref')}")
-                            print(f"   SHA: {result.get('sha')}")
-                            print(f"   Created: {result.get('created_at')}")
-                            print(f"   Updated: {result.get('updated_at')}")
-                            print(f"   URL: {result.get('web_url')}")
+                        analyzer.print_pipeline_status(result)
+                    elif args.analyze_failures:
+                        analyzer.print_pipeline_status(result["status"])
+                        analyzer.print_jobs_summary(
+                            result["failed_jobs"], failed_only=True
+                        )
+                        analyzer.print_pipeline_summary(result["analysis"])
                     else:
                         analyzer.print_pipeline_summary(result)
 
-            print("\n✅ Analysis completed successfully!")
+            logger.info("\n✅ Analysis completed successfully!")
 
         except Exception as e:
             print(f"❌ Unexpected error: {str(e)}")
             if args.json:
-                print(json.dumps({"error": str(e)}, indent=2))
+                _print_json({"error": str(e)})
             sys.exit(1)
 
-    # Run the analysis
-    asyncio.run(run_analysis())
+    # Run the analysis, on uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_analysis())
+    else:
+        uvloop.run(run_analysis())
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Copyright (c) 2025 Siarhei Skuratovich
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import importlib.util
 import os
 import subprocess  # nosec B404 - subprocess is safe in this test runner context
 import sys
@@ -21,18 +22,25 @@ def run_tests():
     print("🚀 Running MCP Server Tests")
     print("=" * 50)
 
-    # Check if pytest is available
-    try:
-        import pytest
-
-        print("✅ pytest is available")
-    except ImportError:
+    # Check if pytest is available without importing it
+    if importlib.util.find_spec("pytest") is None:
         print("❌ pytest not found. Installing pytest...")
         subprocess.run(  # nosec B603 - trusted input: installing known packages
-            [sys.executable, "-m", "pip", "install", "pytest", "pytest-asyncio"],
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "pytest",
+                "pytest-asyncio",
+                "pytest-xdist",
+            ],
             check=True,
         )
-        import pytest
+    else:
+        print("✅ pytest is available")
+
+    import pytest
 
     # Run tests with pytest
     test_args = [
@@ -40,8 +48,15 @@ def run_tests():
         "--tb=short",  # shorter traceback format
         "tests/",  # test directory
         "--asyncio-mode=auto",  # enable asyncio support
+        "--import-mode=importlib",  # import test modules without sys.path edits
+        "-p",
+        "no:cacheprovider",  # skip writing .pytest_cache
     ]
 
+    # Spread tests over all cores when pytest-xdist is installed
+    if importlib.util.find_spec("xdist") is not None:
+        test_args += ["-n", "auto"]
+
     print("\n🧪 Running tests...")
     print("-" * 30)
 
@@ -86,6 +101,11 @@ def run_coverage():
 
 def main():
     """Main entry point"""
+    # CI checkouts are discarded after the run, so don't write .pyc files
+    if os.environ.get("CI"):
+        sys.dont_write_bytecode = True
+        os.environ["PYTHONDONTWRITEBYTECODE"] = "1"
+
     if len(sys.argv) > 1 and sys.argv[1] == "--coverage":
         return run_coverage()
     else:
@@ -5,7 +5,9 @@ Copyright (c) 2025 Siarhei Skuratovich
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import asyncio
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -21,10 +23,57 @@ class GitLabAnalyzer:
         self.token = token
         self.api_url = f"{self.gitlab_url}/api/v4"
 
-        self.headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        # Built once and shared read-only by every request of this instance
+        self.headers = MappingProxyType(
+            {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+        )
+
+        # Pooled HTTP client shared by every request, see _get_client
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, opening it on first use
+
+        Reusing one client keeps connections alive between requests instead of
+        paying a TCP and TLS handshake for each of them. A client belongs to the
+        event loop it was opened in, so when the loop changes the old client is
+        closed and a new one is opened.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None or self._client_loop is not loop:
+            old_client, old_loop = self._client, self._client_loop
+            # Swap the new client in before awaiting the old one's close, so a
+            # coroutine entering meanwhile reuses it instead of opening another
+            client = self._client = httpx.AsyncClient(timeout=30.0)
+            self._client_loop = loop
+            await self._close_client(old_client, old_loop)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        client, self._client = self._client, None
+        client_loop, self._client_loop = self._client_loop, None
+        await self._close_client(client, client_loop)
+
+    @staticmethod
+    async def _close_client(
+        client: httpx.AsyncClient | None,
+        client_loop: asyncio.AbstractEventLoop | None,
+    ) -> None:
+        """Close a client unless it is missing or its event loop has closed"""
+        if client is None:
+            return
+        if client_loop is not None and client_loop.is_closed():
+            # The connections went away with their event loop and can no
+            # longer be shut down from here
+            return
+        await client.aclose()
 
     async def get_pipeline(
         self, project_id: str | int, pipeline_id: int
@@ -32,10 +81,10 @@ class GitLabAnalyzer:
         """Get pipeline information"""
         url = f"{self.api_url}/projects/{project_id}/pipelines/{pipeline_id}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
 
     async def get_pipeline_jobs(
         self, project_id: str | int, pipeline_id: int
@@ -43,27 +92,27 @@ class GitLabAnalyzer:
         """Get all jobs for a pipeline"""
         url = f"{self.api_url}/projects/{project_id}/pipelines/{pipeline_id}/jobs"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            jobs_data = response.json()
-
-            jobs = []
-            for job_data in jobs_data:
-                job = JobInfo(
-                    id=job_data["id"],
-                    name=job_data["name"],
-                    status=job_data["status"],
-                    stage=job_data["stage"],
-                    created_at=job_data["created_at"],
-                    started_at=job_data.get("started_at"),
-                    finished_at=job_data.get("finished_at"),
-                    failure_reason=job_data.get("failure_reason"),
-                    web_url=job_data["web_url"],
-                )
-                jobs.append(job)
-
-            return jobs
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        jobs_data = response.json()
+
+        jobs = []
+        for job_data in jobs_data:
+            job = JobInfo(
+                id=job_data["id"],
+                name=job_data["name"],
+                status=job_data["status"],
+                stage=job_data["stage"],
+                created_at=job_data["created_at"],
+                started_at=job_data.get("started_at"),
+                finished_at=job_data.get("finished_at"),
+                failure_reason=job_data.get("failure_reason"),
+                web_url=job_data["web_url"],
+            )
+            jobs.append(job)
+
+        return jobs
 
     async def get_failed_pipeline_jobs(
         self, project_id: str | int, pipeline_id: int
@@ -72,27 +121,27 @@ class GitLabAnalyzer:
         url = f"{self.api_url}/projects/{project_id}/pipelines/{pipeline_id}/jobs"
         params = {"scope[]": "failed"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            jobs_data = response.json()
-
-            jobs = []
-            for job_data in jobs_data:
-                job = JobInfo(
-                    id=job_data["id"],
-                    name=job_data["name"],
-                    status=job_data["status"],
-                    stage=job_data["stage"],
-                    created_at=job_data["created_at"],
-                    started_at=job_data.get("started_at"),
-                    finished_at=job_data.get("finished_at"),
-                    failure_reason=job_data.get("failure_reason"),
-                    web_url=job_data["web_url"],
-                )
-                jobs.append(job)
-
-            return jobs
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        jobs_data = response.json()
+
+        jobs = []
+        for job_data in jobs_data:
+            job = JobInfo(
+                id=job_data["id"],
+                name=job_data["name"],
+                status=job_data["status"],
+                stage=job_data["stage"],
+                created_at=job_data["created_at"],
+                started_at=job_data.get("started_at"),
+                finished_at=job_data.get("finished_at"),
+                failure_reason=job_data.get("failure_reason"),
+                web_url=job_data["web_url"],
+            )
+            jobs.append(job)
+
+        return jobs
 
     async def get_job_info(
         self, project_id: str | int, job_id: int
@@ -100,23 +149,27 @@ class GitLabAnalyzer:
         """Get information for a specific job"""
         url = f"{self.api_url}/projects/{project_id}/jobs/{job_id}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
 
     async def get_job_trace(self, project_id: str | int, job_id: int) -> str:
         """Get the trace log for a specific job"""
         url = f"{self.api_url}/projects/{project_id}/jobs/{job_id}/trace"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:  # Longer timeout for logs
-            response = await client.get(url, headers=self.headers)
-            if response.status_code == 404:
-                return ""
-            response.raise_for_status()
-            return response.text
+        client = await self._get_client()
+        response = await client.get(
+            url,
+            headers=self.headers,
+            timeout=60.0,  # Longer timeout for logs
+        )
+        if response.status_code == 404:
+            return ""
+        response.raise_for_status()
+        return response.text
 
     async def get_merge_request(
         self, project_id: str | int, merge_request_iid: int
@@ -124,10 +177,10 @@ class GitLabAnalyzer:
         """Get merge request information by IID"""
         url = f"{self.api_url}/projects/{project_id}/merge_requests/{merge_request_iid}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
 
     async def get_merge_request_overview(
         self, project_id: str | int, merge_request_iid: int
@@ -217,10 +270,10 @@ class GitLabAnalyzer:
         """
         url = f"{self.api_url}/projects/{project_id}/merge_requests/{merge_request_iid}/discussions"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
 
     async def get_merge_request_notes(
         self, project_id: str | int, merge_request_iid: int
@@ -253,10 +306,10 @@ class GitLabAnalyzer:
         """
         url = f"{self.api_url}/projects/{project_id}/merge_requests/{merge_request_iid}/notes"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
 
     async def get_merge_request_review_summary(
         self, project_id: str | int, merge_request_iid: int
@@ -286,10 +339,10 @@ class GitLabAnalyzer:
         """
         try:
             # Get both discussions and notes
-            discussions = await self.get_merge_request_discussions(
-                project_id, merge_request_iid
+            discussions, notes = await asyncio.gather(
+                self.get_merge_request_discussions(project_id, merge_request_iid),
+                self.get_merge_request_notes(project_id, merge_request_iid),
             )
-            notes = await self.get_merge_request_notes(project_id, merge_request_iid)
 
             # Categorize review feedback
             review_comments = []
@@ -469,10 +522,10 @@ class GitLabAnalyzer:
         if branch:
             params["ref"] = branch
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
 
     async def search_project_commits(
         self,
@@ -502,7 +555,7 @@ class GitLabAnalyzer:
         if branch:
             params["ref"] = branch
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        client = await self._get_client()
+        response = await client.get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
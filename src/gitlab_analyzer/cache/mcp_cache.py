@@ -15,6 +15,7 @@ import json
 import os
 import sqlite3
 import sys
+import traceback
 from pathlib import Path
 from typing import Any
 
@@ -351,8 +352,6 @@ class McpCache:
             error_print(f"❌ [ERROR] Database path: {self.db_path}")
 
             # Add traceback for debugging
-            import traceback
-
             error_print("❌ [ERROR] Traceback:")
             traceback.print_exc()
             raise
@@ -718,8 +717,6 @@ class McpCache:
 
         except Exception as e:
             error_print(f"ERROR: Failed to store failed jobs: {e}")
-            import traceback
-
             traceback.print_exc()
             raise
 
@@ -796,8 +793,6 @@ class McpCache:
 
         except Exception as e:
             error_print(f"ERROR: Failed to store job file errors: {e}")
-            import traceback
-
             traceback.print_exc()
             raise
 
@@ -854,8 +849,6 @@ class McpCache:
 
         except Exception as e:
             error_print(f"ERROR: Failed to store trace segments: {e}")
-            import traceback
-
             traceback.print_exc()
 
     async def get_pipeline_jobs(self, pipeline_id: int) -> list[dict[str, Any]]:
@@ -2001,8 +1994,6 @@ class McpCache:
 
         except Exception as e:
             error_print(f"❌ [HEALTH] Health check failed: {e}")
-            import traceback
-
             traceback.print_exc()
 
             return {
@@ -2114,8 +2105,6 @@ def get_cache_manager(db_path: str | None = None) -> McpCache:
         except Exception as e:
             error_print(f"❌ [ERROR] Failed to create global McpCache instance: {e}")
             error_print(f"❌ [ERROR] Exception type: {type(e).__name__}")
-            import traceback
-
             error_print("❌ [ERROR] Traceback:")
             traceback.print_exc()
             raise
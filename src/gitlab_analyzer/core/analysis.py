@@ -5,9 +5,11 @@ This module contains pure functions that were previously embedded in MCP tools.
 Following DRY and KISS principles, these functions can be reused across tools and resources.
 """
 
+import asyncio
 import json
 import logging
 import re
+from functools import partial
 from typing import Any
 
 from gitlab_analyzer.api.client import GitLabAnalyzer
@@ -22,6 +24,9 @@ from gitlab_analyzer.utils.debug import debug_print, verbose_debug_print
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous trace downloads in analyze_pipeline_jobs
+MAX_CONCURRENT_JOB_ANALYSES = 8
+
 
 async def store_jobs_metadata_step(
     cache_manager, project_id: str | int, pipeline_id: int, jobs
@@ -146,6 +151,109 @@ async def store_job_analysis_step(
         logger.error("Error storing job analysis for %s: %s", job_id, e)
 
 
+# Pattern groups used by is_pytest_job, compiled once. Name and stage patterns
+# are matched against the lowercased value; trace patterns ignore case.
+
+# Trace patterns of a failed linting job, checked before anything else
+_LINTING_INDICATORS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"make:.*\[.*lint.*\].*Error",  # make lint failures like "make: *** [makes/py.mk:55: py/lint/ruff] Error 1"
+        r"lint.*failed",  # general lint failures
+        r"ruff.*check.*failed",  # ruff specific failures
+        r"black.*check.*failed",  # black specific failures
+        r"flake8.*failed",  # flake8 specific failures
+        r"pylint.*failed",  # pylint specific failures
+    )
+)
+
+_PYTEST_NAME_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"test",
+        r"pytest",
+        r"unit.*test",
+        r"integration.*test",
+        r"e2e.*test",
+    )
+)
+
+# High-confidence pytest indicators (structural markers)
+_PYTEST_HIGH_CONFIDENCE_INDICATORS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"=+\s*FAILURES\s*=+",  # pytest FAILURES section
+        r"=+\s*test session starts\s*=+",  # pytest session start
+        r"collected \d+ items?",  # pytest collection message
+        r"::\w+.*FAILED",  # pytest test failure format
+        r"conftest\.py",  # pytest configuration file
+        r"short test summary info",  # pytest summary section
+        r"FAILED.*::\w+",  # Alternative FAILED pattern
+    )
+)
+
+# Medium-confidence indicators (command patterns)
+_PYTEST_COMMAND_INDICATORS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"uv run.*pytest",  # Common uv + pytest pattern
+        r"coverage run -m pytest",  # Coverage + pytest pattern
+        r"python -m pytest",  # Direct pytest module run
+        r"pytest.*\.py",  # pytest with python files
+    )
+)
+
+_NON_PYTEST_NAME_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^lint-",  # Jobs starting with "lint-"
+        r"^format-",  # Jobs starting with "format-"
+        r"^build-",  # Jobs starting with "build-"
+        r"^deploy-",  # Jobs starting with "deploy-"
+        r"^package-",  # Jobs starting with "package-"
+        r"^publish-",  # Jobs starting with "publish-"
+        r"^security-",  # Jobs starting with "security-"
+        r"^audit-",  # Jobs starting with "audit-"
+        r"^compliance-",  # Jobs starting with "compliance-"
+    )
+)
+
+_NON_PYTEST_STAGE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^build$",  # Only exact "build" stage
+        r"^deploy$",  # Only exact "deploy" stage
+        r"^package$",  # Only exact "package" stage
+        r"^publish$",  # Only exact "publish" stage
+    )
+)
+
+_PYTEST_STAGE_PATTERNS = tuple(
+    re.compile(pattern) for pattern in (r"test", r"testing", r"unit", r"integration")
+)
+
+# Lowercase literals that at least one pattern of each trace group requires.
+# An ASCII trace containing none of them cannot match that group, so the
+# regex scans over it are skipped.
+_LINTING_TRACE_LITERALS = ("lint", "failed")
+_PYTEST_TRACE_LITERALS = (
+    "failures",
+    "test session starts",
+    "collected",
+    "failed",
+    "conftest",
+    "short test summary info",
+    "pytest",
+)
+
+
+def _may_match_trace(trace_lower: str | None, literals: tuple[str, ...]) -> bool:
+    """Return False only when a lowercased trace contains none of the literals"""
+    if trace_lower is None:
+        return True
+    return any(literal in trace_lower for literal in literals)
+
+
 def is_pytest_job(
     job_name: str = "", job_stage: str = "", trace_content: str = ""
 ) -> bool:
@@ -164,37 +272,30 @@ def is_pytest_job(
         f"🔍 PYTEST DETECTION: Analyzing job '{job_name}' (stage: '{job_stage}')"
     )
 
+    # Case-insensitive regexes can't use a literal prefix search, so lowercase the
+    # trace once for cheap substring checks. Non-ASCII traces keep the full scan
+    # because str.lower() and re.IGNORECASE fold some characters differently.
+    trace_lower = (
+        trace_content.lower() if trace_content and trace_content.isascii() else None
+    )
+
     # FIRST: Check trace content for explicit linting patterns (highest priority)
-    if trace_content:
-        linting_indicators = [
-            r"make:.*\[.*lint.*\].*Error",  # make lint failures like "make: *** [makes/py.mk:55: py/lint/ruff] Error 1"
-            r"lint.*failed",  # general lint failures
-            r"ruff.*check.*failed",  # ruff specific failures
-            r"black.*check.*failed",  # black specific failures
-            r"flake8.*failed",  # flake8 specific failures
-            r"pylint.*failed",  # pylint specific failures
-        ]
-
-        for indicator in linting_indicators:
-            if re.search(indicator, trace_content, re.IGNORECASE):
+    if trace_content and _may_match_trace(trace_lower, _LINTING_TRACE_LITERALS):
+        for indicator in _LINTING_INDICATORS:
+            if indicator.search(trace_content):
                 debug_print(
-                    f"❌ PYTEST DETECTION: Trace contains linting pattern '{indicator}' - this is a linting job"
+                    f"❌ PYTEST DETECTION: Trace contains linting pattern '{indicator.pattern}' - this is a linting job"
                 )
                 return False
 
-    # SECOND: Check job name patterns for pytest FIRST (positive indicators have priority)
-    pytest_name_patterns = [
-        r"test",
-        r"pytest",
-        r"unit.*test",
-        r"integration.*test",
-        r"e2e.*test",
-    ]
+    job_name_lower = job_name.lower()
+    job_stage_lower = job_stage.lower()
 
-    for pattern in pytest_name_patterns:
-        if re.search(pattern, job_name.lower()):
+    # SECOND: Check job name patterns for pytest FIRST (positive indicators have priority)
+    for pattern in _PYTEST_NAME_PATTERNS:
+        if pattern.search(job_name_lower):
             debug_print(
-                f"✅ PYTEST DETECTION: Job name '{job_name}' matches pattern '{pattern}'"
+                f"✅ PYTEST DETECTION: Job name '{job_name}' matches pattern '{pattern.pattern}'"
             )
             return True
 
@@ -204,84 +305,44 @@ def is_pytest_job(
             f"🔍 PYTEST DETECTION: Checking trace content ({len(trace_content)} chars)"
         )
 
-        # High-confidence pytest indicators (structural markers)
-        high_confidence_indicators = [
-            r"=+\s*FAILURES\s*=+",  # pytest FAILURES section
-            r"=+\s*test session starts\s*=+",  # pytest session start
-            r"collected \d+ items?",  # pytest collection message
-            r"::\w+.*FAILED",  # pytest test failure format
-            r"conftest\.py",  # pytest configuration file
-            r"short test summary info",  # pytest summary section
-            r"FAILED.*::\w+",  # Alternative FAILED pattern
-        ]
-
-        for indicator in high_confidence_indicators:
-            if re.search(indicator, trace_content, re.IGNORECASE):
-                debug_print(
-                    f"✅ PYTEST DETECTION: Trace contains high-confidence pytest indicator '{indicator}'"
-                )
-                return True
-
-        # Medium-confidence indicators (command patterns)
-        command_indicators = [
-            r"uv run.*pytest",  # Common uv + pytest pattern
-            r"coverage run -m pytest",  # Coverage + pytest pattern
-            r"python -m pytest",  # Direct pytest module run
-            r"pytest.*\.py",  # pytest with python files
-        ]
-
-        for indicator in command_indicators:
-            if re.search(indicator, trace_content, re.IGNORECASE):
-                debug_print(
-                    f"✅ PYTEST DETECTION: Trace contains command indicator '{indicator}'"
-                )
-                return True
+        if _may_match_trace(trace_lower, _PYTEST_TRACE_LITERALS):
+            for indicator in _PYTEST_HIGH_CONFIDENCE_INDICATORS:
+                if indicator.search(trace_content):
+                    debug_print(
+                        f"✅ PYTEST DETECTION: Trace contains high-confidence pytest indicator '{indicator.pattern}'"
+                    )
+                    return True
+
+            for indicator in _PYTEST_COMMAND_INDICATORS:
+                if indicator.search(trace_content):
+                    debug_print(
+                        f"✅ PYTEST DETECTION: Trace contains command indicator '{indicator.pattern}'"
+                    )
+                    return True
 
     # FOURTH: Check for explicit non-pytest jobs by name (but be more specific)
     # Only exclude if it's clearly NOT a test job
-    non_pytest_name_patterns = [
-        r"^lint-",  # Jobs starting with "lint-"
-        r"^format-",  # Jobs starting with "format-"
-        r"^build-",  # Jobs starting with "build-"
-        r"^deploy-",  # Jobs starting with "deploy-"
-        r"^package-",  # Jobs starting with "package-"
-        r"^publish-",  # Jobs starting with "publish-"
-        r"^security-",  # Jobs starting with "security-"
-        r"^audit-",  # Jobs starting with "audit-"
-        r"^compliance-",  # Jobs starting with "compliance-"
-    ]
-
-    # If job name explicitly indicates non-pytest work, return False
-    for pattern in non_pytest_name_patterns:
-        if re.search(pattern, job_name.lower()):
+    for pattern in _NON_PYTEST_NAME_PATTERNS:
+        if pattern.search(job_name_lower):
             debug_print(
-                f"❌ PYTEST DETECTION: Job name '{job_name}' matches non-pytest pattern '{pattern}'"
+                f"❌ PYTEST DETECTION: Job name '{job_name}' matches non-pytest pattern '{pattern.pattern}'"
             )
             return False
 
     # FIFTH: Check stage patterns, but only exclude obvious non-test stages
     # Be careful not to exclude "quality" stage if it contains test jobs
-    non_pytest_stage_patterns = [
-        r"^build$",  # Only exact "build" stage
-        r"^deploy$",  # Only exact "deploy" stage
-        r"^package$",  # Only exact "package" stage
-        r"^publish$",  # Only exact "publish" stage
-    ]
-
-    for pattern in non_pytest_stage_patterns:
-        if re.search(pattern, job_stage.lower()):
+    for pattern in _NON_PYTEST_STAGE_PATTERNS:
+        if pattern.search(job_stage_lower):
             debug_print(
-                f"❌ PYTEST DETECTION: Job stage '{job_stage}' matches non-pytest pattern '{pattern}'"
+                f"❌ PYTEST DETECTION: Job stage '{job_stage}' matches non-pytest pattern '{pattern.pattern}'"
             )
             return False
 
     # SIXTH: Check job stage patterns for pytest
-    pytest_stage_patterns = [r"test", r"testing", r"unit", r"integration"]
-
-    for pattern in pytest_stage_patterns:
-        if re.search(pattern, job_stage.lower()):
+    for pattern in _PYTEST_STAGE_PATTERNS:
+        if pattern.search(job_stage_lower):
             debug_print(
-                f"✅ PYTEST DETECTION: Job stage '{job_stage}' matches pattern '{pattern}'"
+                f"✅ PYTEST DETECTION: Job stage '{job_stage}' matches pattern '{pattern.pattern}'"
             )
             return True
 
@@ -540,30 +601,24 @@ def parse_generic_logs(trace_content: str) -> dict[str, Any]:
 
     debug_print(f"📊 GENERIC PARSER: Extracted {len(log_entries)} total log entries")
 
-    errors = [
-        {
-            "message": entry.message,
-            "level": entry.level,
-            "line_number": entry.line_number,
-            "context": entry.context,
-        }
-        for entry in log_entries
-        if entry.level == "error"
-    ]
-
-    debug_print(f"📊 GENERIC PARSER: Found {len(errors)} error entries")
+    errors: list[dict[str, Any]] = []
+    warnings: list[dict[str, Any]] = []
+    buckets = {"error": errors, "warning": warnings}
 
-    warnings = [
-        {
-            "message": entry.message,
-            "level": entry.level,
-            "line_number": entry.line_number,
-            "context": entry.context,
-        }
-        for entry in log_entries
-        if entry.level == "warning"
-    ]
+    # Bucket entries by level in a single pass over the parsed log
+    for entry in log_entries:
+        bucket = buckets.get(entry.level)
+        if bucket is not None:
+            bucket.append(
+                {
+                    "message": entry.message,
+                    "level": entry.level,
+                    "line_number": entry.line_number,
+                    "context": entry.context,
+                }
+            )
 
+    debug_print(f"📊 GENERIC PARSER: Found {len(errors)} error entries")
     debug_print(f"📊 GENERIC PARSER: Found {len(warnings)} warning entries")
 
     result = {
@@ -671,69 +726,86 @@ async def analyze_pipeline_jobs(
         logger.debug("Storing metadata for %d jobs", len(jobs))
         await store_jobs_metadata_step(cache_manager, project_id, pipeline_id, jobs)
 
-    analyzed_jobs = []
-    total_errors = 0
-    total_warnings = 0
-
-    # Now process each job's trace and analysis (Step 2B: Job Analysis)
-    for job in jobs:
-        job_id = job.id
-        job_name = job.name
-        job_stage = job.stage
-
-        try:
-            # Get job trace
-            trace = await analyzer.get_job_trace(project_id, job_id)
-
-            # Parse with optimal parser
-            parsed_data = parse_job_logs(
+    # Now process each job's trace and analysis (Step 2B: Job Analysis).
+    # Traces are fetched concurrently, bounded to stay within GitLab rate limits.
+    trace_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOB_ANALYSES)
+    # Progressive storage writes one job at a time to avoid SQLite lock contention
+    storage_lock = asyncio.Lock()
+
+    async def analyze_job(job) -> dict[str, Any]:
+        async with trace_semaphore:
+            trace = await analyzer.get_job_trace(project_id, job.id)
+
+        # Parse with optimal parser off the event loop, so the remaining trace
+        # downloads keep moving while a large log is processed
+        loop = asyncio.get_running_loop()
+        parsed_data = await loop.run_in_executor(
+            None,
+            partial(
+                parse_job_logs,
                 trace_content=trace,
                 parser_type="auto",
-                job_name=job_name,
-                job_stage=job_stage,
-            )
-
-            # Filter meaningless errors
-            filtered_data = filter_unknown_errors(parsed_data)
-
-            job_analysis = {
-                "job_id": job_id,
-                "job_name": job_name,
-                "job_stage": job_stage,
-                "job_status": job.status,
-                "analysis": filtered_data,
-            }
+                job_name=job.name,
+                job_stage=job.stage,
+            ),
+        )
 
-            analyzed_jobs.append(job_analysis)
+        # Filter meaningless errors
+        filtered_data = filter_unknown_errors(parsed_data)
 
-            # Progressive storage: Store job data immediately
-            if cache_manager:
+        # Progressive storage: Store job data as soon as the job is analyzed,
+        # so the trace does not have to be kept until every job has finished
+        if cache_manager:
+            async with storage_lock:
                 await store_job_analysis_step(
                     cache_manager,
                     project_id,
                     pipeline_id,
-                    job_id,
+                    job.id,
                     job,
                     trace,
                     filtered_data,
                 )
 
-            total_errors += filtered_data.get("error_count", 0)
-            total_warnings += filtered_data.get("warning_count", 0)
+        return filtered_data
+
+    results = await asyncio.gather(
+        *(analyze_job(job) for job in jobs), return_exceptions=True
+    )
+
+    analyzed_jobs = []
+    total_errors = 0
+    total_warnings = 0
 
-        except Exception as e:
+    for job, result in zip(jobs, results, strict=True):
+        if isinstance(result, Exception):
             analyzed_jobs.append(
                 {
-                    "job_id": job_id,
-                    "job_name": job_name,
-                    "job_stage": job_stage,
+                    "job_id": job.id,
+                    "job_name": job.name,
+                    "job_stage": job.stage,
                     "job_status": job.status,
                     "analysis": {
-                        "error": f"Failed to analyze job: {str(e)}",
+                        "error": f"Failed to analyze job: {str(result)}",
                         "parser_type": "error",
                     },
                 }
             )
+            continue
+        if isinstance(result, BaseException):
+            raise result
+
+        analyzed_jobs.append(
+            {
+                "job_id": job.id,
+                "job_name": job.name,
+                "job_stage": job.stage,
+                "job_status": job.status,
+                "analysis": result,
+            }
+        )
+        total_errors += result.get("error_count", 0)
+        total_warnings += result.get("warning_count", 0)
 
     return {
         "pipeline_id": pipeline_id,
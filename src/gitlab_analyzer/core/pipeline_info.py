@@ -5,6 +5,7 @@ This module provides reusable functions for getting comprehensive pipeline
 information including proper branch resolution for merge request pipelines.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -86,26 +87,34 @@ async def get_comprehensive_pipeline_info(
             # Use source branch as target for commits
             target_branch = merge_request_info["source_branch"]
 
-            # Get comprehensive MR overview
+            # Get MR overview and code review summary concurrently, they only
+            # depend on the MR IID
+            mr_results = await asyncio.gather(
+                analyzer.get_merge_request_overview(project_id, mr_iid),
+                analyzer.get_merge_request_review_summary(project_id, mr_iid),
+                return_exceptions=True,
+            )
+            overview_result, review_result = mr_results
             mr_review_summary = None
             try:
-                mr_overview = await analyzer.get_merge_request_overview(
-                    project_id, mr_iid
-                )
+                if isinstance(overview_result, BaseException):
+                    raise overview_result
+                mr_overview = overview_result
 
                 # Extract Jira tickets from MR data
                 jira_tickets = extract_jira_from_mr(mr_overview)
 
-                # Get code review summary for additional context
-                try:
-                    mr_review_summary = await analyzer.get_merge_request_review_summary(
-                        project_id, mr_iid
-                    )
-                except (httpx.HTTPError, httpx.RequestError, KeyError) as review_error:
+                if isinstance(
+                    review_result, httpx.HTTPError | httpx.RequestError | KeyError
+                ):
                     # If review summary fails, continue without it
                     mr_review_summary = {
-                        "error": f"Failed to get review summary: {str(review_error)}"
+                        "error": f"Failed to get review summary: {str(review_result)}"
                     }
+                elif isinstance(review_result, BaseException):
+                    raise review_result
+                else:
+                    mr_review_summary = review_result
 
             except (httpx.HTTPError, httpx.RequestError, KeyError) as overview_error:
                 # If overview fails, still continue with basic MR info
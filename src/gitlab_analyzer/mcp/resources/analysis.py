@@ -7,7 +7,9 @@ Licensed under the MIT License - see LICENSE file for details
 
 import json
 import logging
+from collections import Counter
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any
 
 from mcp.types import TextResourceContents
@@ -311,11 +313,7 @@ def _identify_patterns(log_entries):
 
 def _group_jobs_by_status(jobs):
     """Group jobs by their status"""
-    status_groups = {}
-    for job in jobs:
-        status = job.status if hasattr(job, "status") else "unknown"
-        status_groups[status] = status_groups.get(status, 0) + 1
-    return status_groups
+    return dict(Counter(getattr(job, "status", "unknown") for job in jobs))
 
 
 def _identify_pipeline_patterns(jobs):
@@ -323,16 +321,16 @@ def _identify_pipeline_patterns(jobs):
     patterns = []
 
     # Check for stage-specific failures
-    failed_stages = set()
-    for job in jobs:
-        if hasattr(job, "status") and job.status == "failed":
-            stage = job.stage if hasattr(job, "stage") else "unknown"
-            failed_stages.add(stage)
+    failed_stages = {
+        job.stage if hasattr(job, "stage") else "unknown"
+        for job in jobs
+        if hasattr(job, "status") and job.status == "failed"
+    }
 
     if len(failed_stages) > 1:
         patterns.append("multiple_stage_failures")
     elif len(failed_stages) == 1:
-        patterns.append(f"stage_specific_failure_{list(failed_stages)[0]}")
+        patterns.append(f"stage_specific_failure_{next(iter(failed_stages))}")
 
     return patterns
 
@@ -732,10 +730,10 @@ async def _get_job_root_cause_analysis(
                         ),
                         "total_errors_analyzed": len(error_objects),
                         "confidence": root_cause_analysis.confidence,
-                        "most_affected_files": (
-                            list(root_cause_analysis.affected_files)[:5]
-                            if hasattr(root_cause_analysis, "affected_files")
-                            else []
+                        "most_affected_files": list(
+                            islice(
+                                getattr(root_cause_analysis, "affected_files", ()), 5
+                            )
                         ),
                     },
                     "detailed_analysis": analysis_dict,
@@ -1109,10 +1107,10 @@ async def _get_root_cause_analysis(
                         ),
                         "total_errors_analyzed": len(all_errors),
                         "confidence": root_cause_analysis.confidence,
-                        "most_affected_files": (
-                            list(root_cause_analysis.affected_files)[:5]
-                            if hasattr(root_cause_analysis, "affected_files")
-                            else []
+                        "most_affected_files": list(
+                            islice(
+                                getattr(root_cause_analysis, "affected_files", ()), 5
+                            )
                         ),
                     },
                     "detailed_analysis": analysis_dict,
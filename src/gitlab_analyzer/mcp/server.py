@@ -6,15 +6,19 @@ Licensed under the MIT License - see LICENSE file for details
 """
 
 import argparse
+import asyncio
 import os
 from pathlib import Path
+from typing import Any
 
 from fastmcp import FastMCP
 
+from gitlab_analyzer.utils.utils import close_gitlab_analyzer
 from gitlab_analyzer.version import get_version
 
 from .prompts import register_all_prompts
 from .resources import register_all_resources
+from .servers.server import parse_env_file
 from .tools import register_tools
 
 
@@ -44,12 +48,7 @@ def load_env_file() -> None:
     """Load environment variables from .env file if it exists"""
     env_file = Path(__file__).parent / ".." / ".." / ".." / ".env"
     if env_file.exists():
-        with env_file.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ[key] = value
+        os.environ.update(parse_env_file(env_file))
 
 
 def main() -> None:
@@ -84,8 +83,16 @@ def main() -> None:
     mcp = create_server()
 
     if args.transport == "stdio":
-        mcp.run(transport="stdio")
+        transport_kwargs: dict[str, Any] = {}
     elif args.transport == "http":
-        mcp.run(transport="http", host=args.host, port=args.port, path=args.path)
-    elif args.transport == "sse":
-        mcp.run(transport="sse", host=args.host, port=args.port)
+        transport_kwargs = {"host": args.host, "port": args.port, "path": args.path}
+    else:
+        transport_kwargs = {"host": args.host, "port": args.port}
+
+    async def run() -> None:
+        try:
+            await mcp.run_async(transport=args.transport, **transport_kwargs)
+        finally:
+            await close_gitlab_analyzer()
+
+    asyncio.run(run())
@@ -8,6 +8,7 @@ Licensed under the MIT License - see LICENSE file for details
 
 import asyncio
 import os
+import traceback
 
 from gitlab_analyzer.cache.mcp_cache import get_cache_manager
 from gitlab_analyzer.mcp.servers.server import create_server, load_env_file
@@ -16,6 +17,7 @@ from gitlab_analyzer.utils.debug import (
     error_print,
     startup_print,
 )
+from gitlab_analyzer.utils.utils import close_gitlab_analyzer
 
 
 async def startup():
@@ -60,8 +62,6 @@ async def startup():
     except Exception as e:
         error_print(f"❌ [STARTUP ERROR] Failed to initialize cache manager: {e}")
         error_print(f"❌ [STARTUP ERROR] Exception type: {type(e).__name__}")
-        import traceback
-
         error_print("❌ [STARTUP ERROR] Traceback:")
         traceback.print_exc()
         raise
@@ -84,7 +84,10 @@ async def run_http_server():
     await startup()
 
     # Run HTTP server asynchronously
-    await mcp.run_http_async(host=host, port=port, path=path)
+    try:
+        await mcp.run_http_async(host=host, port=port, path=path)
+    finally:
+        await close_gitlab_analyzer()
 
 
 def main() -> None:
@@ -7,6 +7,8 @@ Licensed under the MIT License - see LICENSE file for details
 
 import argparse
 import os
+import re
+import traceback
 from pathlib import Path
 
 from fastmcp import FastMCP
@@ -19,6 +21,7 @@ from gitlab_analyzer.utils.debug import (
     error_print,
     startup_print,
 )
+from gitlab_analyzer.utils.utils import close_gitlab_analyzer
 from gitlab_analyzer.version import get_version
 
 
@@ -51,16 +54,48 @@ def create_server() -> FastMCP:
     return mcp
 
 
-def load_env_file() -> None:
-    """Load environment variables from .env file if it exists"""
-    env_file = Path(__file__).parent / ".." / ".." / ".." / ".." / ".env"
-    if env_file.exists():
-        with env_file.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ[key] = value
+# Default location of the project-level .env file
+ENV_FILE = Path(__file__).parent / ".." / ".." / ".." / ".." / ".env"
+
+# Parsed .env contents keyed by file path: (mtime, variables)
+_ENV_CACHE: dict[str, tuple[float, dict[str, str]]] = {}
+
+# Variables that make the .env file unnecessary when already exported
+REQUIRED_ENV_VARS = ("GITLAB_URL", "GITLAB_TOKEN")
+
+# KEY=VALUE lines; blank lines, comments and lines without "=" never match
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*)=(.*?)[^\S\n]*$", re.MULTILINE)
+
+
+def parse_env_file(env_file: Path) -> dict[str, str]:
+    """Parse KEY=VALUE pairs from a .env file in a single regex pass"""
+    return dict(_ENV_LINE_RE.findall(env_file.read_text(encoding="utf-8")))
+
+
+def load_env_file(env_file: Path | None = None) -> None:
+    """
+    Load environment variables from .env file if it exists
+
+    The parsed file is memoized by modification time, so repeated calls
+    only re-read the file when it has changed on disk. The file is skipped
+    entirely when the required variables are already set (container, CI).
+    """
+    if all(key in os.environ for key in REQUIRED_ENV_VARS):
+        return
+
+    env_file = env_file or ENV_FILE
+    try:
+        mtime = env_file.stat().st_mtime
+    except OSError:
+        return
+
+    cache_key = str(env_file)
+    cached = _ENV_CACHE.get(cache_key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, parse_env_file(env_file))
+        _ENV_CACHE[cache_key] = cached
+
+    os.environ.update(cached[1])
 
 
 def main() -> None:
@@ -142,8 +177,6 @@ def main() -> None:
         except Exception as e:
             error_print(f"❌ [STARTUP ERROR] Failed to initialize server: {e}")
             error_print(f"❌ [STARTUP ERROR] Exception type: {type(e).__name__}")
-            import traceback
-
             error_print("❌ [STARTUP ERROR] Traceback:")
             traceback.print_exc()
             raise
@@ -154,7 +187,10 @@ def main() -> None:
 
         async def run_stdio():
             await startup()
-            await mcp.run_stdio_async()
+            try:
+                await mcp.run_stdio_async()
+            finally:
+                await close_gitlab_analyzer()
 
         asyncio.run(run_stdio())
     elif args.transport == "http":
@@ -162,7 +198,10 @@ def main() -> None:
 
         async def run_http():
             await startup()
-            await mcp.run_http_async(host=args.host, port=args.port, path=args.path)
+            try:
+                await mcp.run_http_async(host=args.host, port=args.port, path=args.path)
+            finally:
+                await close_gitlab_analyzer()
 
         asyncio.run(run_http())
     elif args.transport == "sse":
@@ -170,6 +209,9 @@ def main() -> None:
 
         async def run_sse():
             await startup()
-            await mcp.run_sse_async(host=args.host, port=args.port)
+            try:
+                await mcp.run_sse_async(host=args.host, port=args.port)
+            finally:
+                await close_gitlab_analyzer()
 
         asyncio.run(run_sse())
@@ -95,10 +95,9 @@ def register_clean_trace_tools(mcp: FastMCP) -> None:
             debug_print("🧹 Cleaning ANSI escape sequences from trace...")
             cleaned_trace = BaseParser.clean_ansi_sequences(trace_content)
 
-            # Calculate basic stats
-            lines = cleaned_trace.split("\n")
+            # Calculate basic stats without splitting the whole trace into lines
             trace_length = len(cleaned_trace)
-            trace_lines = len(lines)
+            trace_lines = cleaned_trace.count("\n") + 1
             verbose_debug_print(
                 f"📊 Cleaned trace: {trace_length} characters, {trace_lines} lines"
             )
@@ -129,6 +128,7 @@ def register_clean_trace_tools(mcp: FastMCP) -> None:
                     "📊 Building JSON format with preview and error indicators..."
                 )
                 # For JSON format, include trace excerpts
+                lines = cleaned_trace.split("\n")
                 result.update(
                     {
                         "trace_preview": {
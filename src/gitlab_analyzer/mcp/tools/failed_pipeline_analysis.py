@@ -52,6 +52,9 @@ from gitlab_analyzer.utils.utils import (
     should_exclude_file_path,
 )
 
+# Upper bound on simultaneous trace downloads, to stay within GitLab rate limits
+MAX_CONCURRENT_TRACE_FETCHES = 10
+
 
 def _filter_duplicate_combined_errors(errors: list) -> list:
     """Filter duplicates from combined error results (local implementation)"""
@@ -277,7 +280,20 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                     f"🔧 File exclusion patterns: {len(exclude_patterns)} patterns configured"
                 )
 
-            for job_index, job in enumerate(failed_jobs, 1):
+            # Start fetching all traces up front so the analysis below does not
+            # wait on one sequential round-trip per job; each job only waits for
+            # its own trace, so parsing overlaps the downloads still in flight
+            debug_print(f"📥 Fetching traces for {len(failed_jobs)} failed jobs...")
+            trace_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACE_FETCHES)
+
+            async def fetch_trace(job_id: int) -> str:
+                async with trace_semaphore:
+                    return await analyzer.get_job_trace(project_id, job_id)
+
+            async def analyze_failed_job(
+                job_index: int, job: Any, trace_task: "asyncio.Task[str] | None"
+            ) -> dict[str, Any]:
+                """Analyze one failed job and store its results when requested"""
                 debug_print(
                     f"🔍 [{job_index}/{len(failed_jobs)}] Analyzing job {job.name} (ID: {job.id})"
                 )
@@ -286,10 +302,9 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                 )
 
                 job_start_time = time.time()
-                debug_print(f"📥 Fetching trace for job {job.id}...")
-                trace = await analyzer.get_job_trace(project_id, job.id)
-                trace_length = len(trace) if trace else 0
-                verbose_debug_print(f"📊 Trace retrieved: {trace_length} characters")
+                trace = await trace_task if trace_task is not None else None
+                if trace is not None:
+                    verbose_debug_print(f"📊 Trace retrieved: {len(trace)} characters")
 
                 # Use analyze_job_trace for consistent job analysis (eliminates code duplication)
                 from .job_analysis_tools import analyze_job_trace
@@ -309,6 +324,7 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                     disable_file_filtering=disable_file_filtering,
                     store_in_db=store_in_db,  # This will handle database storage if needed
                     pipeline_id=pipeline_id,
+                    job_status=job.status,
                 )
 
                 debug_print(
@@ -441,6 +457,9 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                 # Store file and error info in DB (using filtered data)
                 if store_in_db:
                     verbose_debug_print("💾 Storing job analysis data in database...")
+                    # Traces are always downloaded when storing, even for
+                    # jobs whose parse result was cached
+                    assert trace is not None
                     # Calculate trace hash for consistency tracking
                     trace_hash = hashlib.sha256(trace.encode("utf-8")).hexdigest()
                     verbose_debug_print(
@@ -479,7 +498,7 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                     }
                     # Store only errors and trace segments without overwriting job metadata
                     # (job metadata was already stored correctly by store_failed_jobs_basic)
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     await loop.run_in_executor(
                         None,
                         cache_manager.store_errors_only,
@@ -493,21 +512,53 @@ def register_failed_pipeline_analysis_tools(mcp: FastMCP) -> None:
                     f"✅ Job {job.name} analysis completed in {job_duration:.2f}s"
                 )
 
-                job_analysis_results.append(
-                    {
-                        "job_id": job.id,
-                        "job_name": job.name,
-                        "parser_type": analysis_result.get("parser_type", "unknown"),
-                        "file_groups": list(file_groups.values()),
-                        "categorized_files": categorized,
-                        "errors": filtered_errors,  # Use filtered errors
-                        "filtering_stats": {
-                            "original_errors": original_error_count,
-                            "filtered_errors": filtered_error_count,
-                            "excluded_errors": filtered_out_count,
-                        },
-                    }
+                return {
+                    "job_id": job.id,
+                    "job_name": job.name,
+                    "parser_type": analysis_result.get("parser_type", "unknown"),
+                    "file_groups": list(file_groups.values()),
+                    "categorized_files": categorized,
+                    "errors": filtered_errors,  # Use filtered errors
+                    "filtering_stats": {
+                        "original_errors": original_error_count,
+                        "filtered_errors": filtered_error_count,
+                        "excluded_errors": filtered_out_count,
+                    },
+                }
+
+            from .job_analysis_tools import is_job_parse_cached
+
+            # Finished jobs that were parsed before need no trace download,
+            # unless the trace is stored alongside the errors
+            trace_tasks = [
+                None
+                if not store_in_db
+                and is_job_parse_cached(
+                    project_id,
+                    job.id,
+                    job.name,
+                    job.stage,
+                    exclude_file_patterns,
+                    job.status,
                 )
+                else asyncio.ensure_future(fetch_trace(job.id))
+                for job in failed_jobs
+            ]
+
+            try:
+                for job_index, (job, trace_task) in enumerate(
+                    zip(failed_jobs, trace_tasks, strict=True), 1
+                ):
+                    job_analysis_results.append(
+                        await analyze_failed_job(job_index, job, trace_task)
+                    )
+            finally:
+                # Do not leave downloads running after an early exit, e.g. when
+                # one job's fetch or analysis raised partway through the loop
+                pending_tasks = [task for task in trace_tasks if task is not None]
+                for trace_task in pending_tasks:
+                    trace_task.cancel()
+                await asyncio.gather(*pending_tasks, return_exceptions=True)
 
             debug_print(
                 "📊 Step 5: Building analysis results and resource structure..."
@@ -8,7 +8,11 @@ Copyright (c) 2025 Siarhei Skuratovich
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import asyncio
+import copy
 import time
+from collections import OrderedDict
+from functools import partial
 from typing import Any
 
 from fastmcp import FastMCP
@@ -18,33 +22,111 @@ from gitlab_analyzer.core.analysis import store_job_analysis_step
 from gitlab_analyzer.utils.debug import debug_print, error_print, verbose_debug_print
 from gitlab_analyzer.utils.utils import get_gitlab_analyzer, get_mcp_info
 
+# Parse results of recently analysed finished jobs, least recently used first.
+# The trace of a finished job never changes, so a hit skips both the trace
+# download and the parsers. Entries hold (trace length, parse result).
+PARSE_CACHE_SIZE = 64
+_PARSE_CACHE: OrderedDict[tuple[Any, ...], tuple[int, dict[str, Any]]] = OrderedDict()
+
+# Job statuses whose trace is final
+FINISHED_JOB_STATUSES = frozenset({"success", "failed", "canceled"})
+
+
+def _parse_cache_key(
+    project_id: str | int,
+    job_id: int,
+    job_name: str,
+    job_stage: str,
+    exclude_file_patterns: list[str] | None,
+) -> tuple[Any, ...]:
+    """Build the _PARSE_CACHE key for a job and the options it is parsed with"""
+    return (
+        str(project_id),
+        job_id,
+        job_name,
+        job_stage,
+        tuple(exclude_file_patterns or ()),
+    )
+
+
+def is_job_parse_cached(
+    project_id: str | int,
+    job_id: int,
+    job_name: str = "",
+    job_stage: str = "",
+    exclude_file_patterns: list[str] | None = None,
+    job_status: str = "",
+) -> bool:
+    """Check whether analyze_job_trace can analyze a job without its trace"""
+    return job_status in FINISHED_JOB_STATUSES and (
+        _parse_cache_key(project_id, job_id, job_name, job_stage, exclude_file_patterns)
+        in _PARSE_CACHE
+    )
+
 
 async def analyze_job_trace(
     project_id: str | int,
     job_id: int,
-    trace_content: str,
+    trace_content: str | None,
     job_name: str = "",
     job_stage: str = "",
     exclude_file_patterns: list[str] | None = None,
     disable_file_filtering: bool = False,
     store_in_db: bool = True,
     pipeline_id: int = 0,
+    job_status: str = "",
 ) -> dict[str, Any]:
-    """Analyze job trace and extract errors using enhanced parsing logic"""
+    """
+    Analyze job trace and extract errors using enhanced parsing logic
+
+    Results for jobs in a finished status are cached. When is_job_parse_cached
+    reports a hit, trace_content may be None; it is downloaded if the entry
+    has been evicted in the meantime.
+    """
     try:
         from gitlab_analyzer.core.analysis import parse_job_logs
 
         cache_manager = get_cache_manager()
 
-        # Use enhanced parsing logic from analysis.py with auto-detection
-        parsed_result = parse_job_logs(
-            trace_content=trace_content,
-            parser_type="auto",
-            job_name=job_name,  # Use actual job name for proper pytest detection
-            job_stage=job_stage,  # Use actual job stage for proper pytest detection
-            include_traceback=True,
-            exclude_paths=exclude_file_patterns,
+        # A finished job always parses to the same result, so reuse it instead
+        # of downloading and parsing its trace again. Copies keep callers from
+        # mutating the cached entry.
+        finished = job_status in FINISHED_JOB_STATUSES
+        parse_key = _parse_cache_key(
+            project_id, job_id, job_name, job_stage, exclude_file_patterns
         )
+        cached = _PARSE_CACHE.get(parse_key) if finished else None
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(parse_key)
+            debug_print(f"♻️ Reusing parsed trace for job {job_id}")
+            trace_length, parsed_result = cached
+            parsed_result = copy.deepcopy(parsed_result)
+        else:
+            if trace_content is None:
+                analyzer = get_gitlab_analyzer()
+                trace_content = await analyzer.get_job_trace(project_id, job_id) or ""
+            trace_length = len(trace_content)
+
+            # Use enhanced parsing logic from analysis.py with auto-detection.
+            # Parsing is CPU-bound, so run it off the event loop to keep other
+            # requests and in-flight trace downloads moving meanwhile
+            loop = asyncio.get_running_loop()
+            parsed_result = await loop.run_in_executor(
+                None,
+                partial(
+                    parse_job_logs,
+                    trace_content=trace_content,
+                    parser_type="auto",
+                    job_name=job_name,  # Use actual job name for proper pytest detection
+                    job_stage=job_stage,  # Use actual job stage for proper pytest detection
+                    include_traceback=True,
+                    exclude_paths=exclude_file_patterns,
+                ),
+            )
+            if finished:
+                _PARSE_CACHE[parse_key] = (trace_length, copy.deepcopy(parsed_result))
+                if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                    _PARSE_CACHE.popitem(last=False)
 
         debug_print(
             f"🔧 Enhanced parsing result: {parsed_result.get('parser_type', 'unknown')} parser"
@@ -81,6 +163,7 @@ async def analyze_job_trace(
                 "warning_count": parsed_result.get("warning_count", 0),
                 "test_summary": parsed_result.get("test_summary"),
                 "fallback_reason": parsed_result.get("fallback_reason"),
+                "trace_length": trace_length,
             },
         }
 
@@ -102,7 +185,7 @@ async def analyze_job_trace(
                 pipeline_id=pipeline_id,  # Use the correct pipeline_id
                 job_id=job_id,
                 job=job_obj,  # Reconstructed job object with available data
-                trace_content=trace_content,
+                trace_content=trace_content or "",
                 analysis_data=analysis_data,
             )
 
@@ -203,16 +286,32 @@ def register_job_analysis_tools(mcp: FastMCP) -> None:
                 f"✅ Job info retrieved: {job_info.get('name', 'unnamed')} - {job_info.get('status', 'unknown')}"
             )
 
-            # Get job trace
-            debug_print(f"📥 Fetching job trace from GitLab for job {job_id}...")
-            trace_content = await analyzer.get_job_trace(project_id, job_id)
-
-            if not trace_content:
-                debug_print(f"⚠️ No trace found for job {job_id}")
-                trace_content = ""
-
-            trace_length = len(trace_content)
-            verbose_debug_print(f"📊 Trace retrieved: {trace_length} characters")
+            job_name = job_info.get("name", "")
+            job_stage = job_info.get("stage", "")
+            job_status = job_info.get("status", "")
+
+            # Get job trace, unless the finished job has already been parsed
+            trace_content: str | None = None
+            if is_job_parse_cached(
+                project_id,
+                job_id,
+                job_name,
+                job_stage,
+                exclude_file_patterns,
+                job_status,
+            ):
+                debug_print(f"♻️ Job {job_id} already parsed, skipping trace download")
+            else:
+                debug_print(f"📥 Fetching job trace from GitLab for job {job_id}...")
+                trace_content = await analyzer.get_job_trace(project_id, job_id)
+
+                if not trace_content:
+                    debug_print(f"⚠️ No trace found for job {job_id}")
+                    trace_content = ""
+
+                verbose_debug_print(
+                    f"📊 Trace retrieved: {len(trace_content)} characters"
+                )
 
             # Store basic job info in database if requested
             if store_in_db:
@@ -230,12 +329,16 @@ def register_job_analysis_tools(mcp: FastMCP) -> None:
                 project_id=project_id,
                 job_id=job_id,
                 trace_content=trace_content,
-                job_name=job_info.get("name", ""),
-                job_stage=job_info.get("stage", ""),
+                job_name=job_name,
+                job_stage=job_stage,
                 exclude_file_patterns=exclude_file_patterns or [],
                 disable_file_filtering=disable_file_filtering,
                 store_in_db=store_in_db,
                 pipeline_id=pipeline_id,  # Pass the correct pipeline_id
+                job_status=job_status,
+            )
+            trace_length = analysis_result.get("parsing_metadata", {}).get(
+                "trace_length", len(trace_content or "")
             )
 
             verbose_debug_print(
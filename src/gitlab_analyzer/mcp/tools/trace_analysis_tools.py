@@ -9,6 +9,7 @@ Licensed under the MIT License - see LICENSE file for details
 """
 
 import time
+from collections import Counter
 from typing import Any, cast
 
 from fastmcp import FastMCP
@@ -219,6 +220,7 @@ def register_trace_analysis_tools(mcp: FastMCP) -> None:
 
                     general_errors.append(error_detail)
 
+                level_counts = Counter(e["level"] for e in general_errors)
                 general_duration = time.time() - general_start
                 verbose_debug_print(
                     f"General analysis completed in {general_duration:.3f}s"
@@ -227,12 +229,8 @@ def register_trace_analysis_tools(mcp: FastMCP) -> None:
                 results["general_analysis"] = {
                     "errors": general_errors,
                     "total_entries": len(general_errors),
-                    "error_count": len(
-                        [e for e in general_errors if e["level"] == "error"]
-                    ),
-                    "warning_count": len(
-                        [e for e in general_errors if e["level"] == "warning"]
-                    ),
+                    "error_count": level_counts["error"],
+                    "warning_count": level_counts["warning"],
                     "processing_time": general_duration,
                 }
 
@@ -406,15 +404,12 @@ def register_trace_analysis_tools(mcp: FastMCP) -> None:
                         f"Combined duplicate filtering: {len(all_errors)} errors (removed {original_count - len(all_errors)})"
                     )
 
+                level_counts = Counter(e["level"] for e in all_errors)
                 results["combined_analysis"] = {
                     "all_errors": all_errors,
                     "total_errors": len(all_errors),
-                    "error_count": len(
-                        [e for e in all_errors if e["level"] == "error"]
-                    ),
-                    "warning_count": len(
-                        [e for e in all_errors if e["level"] == "warning"]
-                    ),
+                    "error_count": level_counts["error"],
+                    "warning_count": level_counts["warning"],
                 }
 
             # Calculate total duration
@@ -13,6 +13,31 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Protocol
 
+# Enhanced ANSI sequence removal
+_ANSI_ESCAPE_RE = re.compile(
+    r"""
+    \x1B    # ESC character
+    (?:     # Non-capturing group for different ANSI sequence types
+        \[  # CSI (Control Sequence Introducer) sequences
+        [0-9;]*  # Parameters (numbers and semicolons)
+        [A-Za-z]  # Final character
+    |       # OR
+        \[  # CSI sequences with additional complexity
+        [0-9;?]*  # Parameters with optional question mark
+        [A-Za-z@-~]  # Final character range
+    |       # OR
+        [@-Z\\-_]  # 7-bit C1 Fe sequences
+    )
+""",
+    re.VERBOSE,
+)
+_CONTROL_CHARS_RE = re.compile(r"[\r\x08\x0c]")
+_SECTION_MARKER_RE = re.compile(r"section_(?:start|end):\d+:\w+\r?")
+_PYTEST_ERROR_PREFIX_RE = re.compile(r"^E\s+", re.MULTILINE)
+_PYTEST_DIFF_ADDITION_RE = re.compile(r"^\s*\+\s*", re.MULTILINE)
+_PYTEST_DIFF_REMOVAL_RE = re.compile(r"^\s*-\s*", re.MULTILINE)
+_MULTIPLE_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
 
 class TestFramework(Enum):
     """Supported test frameworks and CI/CD tools"""
@@ -262,6 +287,11 @@ class BaseParser:
         r"upload project directory and file based variables",
     ]
 
+    # Compiled once, as they are checked against nearly every trace line
+    EXCLUDE_REGEXES = tuple(
+        re.compile(pattern, re.IGNORECASE) for pattern in EXCLUDE_PATTERNS
+    )
+
     # Shared error type classification patterns
     ERROR_TYPE_PATTERNS = [
         # Test failures
@@ -327,50 +357,24 @@ class BaseParser:
     @classmethod
     def clean_ansi_sequences(cls, text: str) -> str:
         """Clean ANSI escape sequences and control characters from log text"""
-        # Enhanced ANSI sequence removal
-        ansi_escape = re.compile(
-            r"""
-            \x1B    # ESC character
-            (?:     # Non-capturing group for different ANSI sequence types
-                \[  # CSI (Control Sequence Introducer) sequences
-                [0-9;]*  # Parameters (numbers and semicolons)
-                [A-Za-z]  # Final character
-            |       # OR
-                \[  # CSI sequences with additional complexity
-                [0-9;?]*  # Parameters with optional question mark
-                [A-Za-z@-~]  # Final character range
-            |       # OR
-                [@-Z\\-_]  # 7-bit C1 Fe sequences
-            )
-        """,
-            re.VERBOSE,
-        )
-
         # Apply ANSI cleaning
-        clean = ansi_escape.sub("", text)
+        clean = _ANSI_ESCAPE_RE.sub("", text)
 
         # Remove control characters but preserve meaningful whitespace
-        clean = re.sub(r"\r", "", clean)  # Remove carriage returns
-        clean = re.sub(r"\x08", "", clean)  # Remove backspace
-        clean = re.sub(r"\x0c", "", clean)  # Remove form feed
+        clean = _CONTROL_CHARS_RE.sub("", clean)  # \r, backspace, form feed
 
         # Remove GitLab CI section markers
-        clean = re.sub(r"section_start:\d+:\w+\r?", "", clean)
-        clean = re.sub(r"section_end:\d+:\w+\r?", "", clean)
+        clean = _SECTION_MARKER_RE.sub("", clean)
 
         # Clean up pytest error prefixes that remain after ANSI removal
         # These are the "E   " prefixes that pytest uses for error highlighting
-        clean = re.sub(r"^E\s+", "", clean, flags=re.MULTILINE)
+        clean = _PYTEST_ERROR_PREFIX_RE.sub("", clean)
 
         # Clean up other pytest formatting artifacts
-        clean = re.sub(
-            r"^\s*\+\s*", "", clean, flags=re.MULTILINE
-        )  # pytest diff additions
-        clean = re.sub(
-            r"^\s*-\s*", "", clean, flags=re.MULTILINE
-        )  # pytest diff removals
+        clean = _PYTEST_DIFF_ADDITION_RE.sub("", clean)  # pytest diff additions
+        clean = _PYTEST_DIFF_REMOVAL_RE.sub("", clean)  # pytest diff removals
 
         # Remove excessive whitespace while preserving structure
-        clean = re.sub(r"\n\s*\n\s*\n", "\n\n", clean)  # Reduce multiple blank lines
+        clean = _MULTIPLE_BLANK_LINES_RE.sub("\n\n", clean)
 
         return clean
@@ -26,6 +26,52 @@ from .base_parser import (
     TestFramework,
 )
 
+# Source location patterns, tried in order to resolve the real file line
+_FILE_LINE_PATTERNS = (
+    re.compile(r'^\s*File\s+"([^"]+)",\s+line\s+(\d+)'),  # Python traceback format
+    re.compile(r"^\s*([^:\s]+):(\d+):\s*in\s+"),  # Ruby/pytest format
+    re.compile(r"^\s*([^:\s]+):(\d+):\s*"),  # Generic file:line format
+    re.compile(r"^\s*([^:\s]+):\s*line\s+(\d+)"),  # Alternative format
+)
+
+# System locations that should not be reported as the source of an error
+_SYSTEM_PATHS = ("/root/.local/share/uv/python/", "site-packages", "/usr/lib")
+
+# Lowercase substrings that every ERROR_PATTERNS / WARNING_PATTERNS match
+# contains; keep in sync with those tables when adding a pattern
+_ENTRY_MARKERS = (
+    "error",
+    "fail",
+    "assert ",
+    ".py:",
+    "->",
+    "docker: ",
+    "exec user process caused",
+    "not a valid identifier",
+    "command not found",
+    "no such file or directory",
+    "permission denied",
+    "could not find",
+    "missing",
+    "reformat",
+    "formatting",
+    "import",
+    "vulnerability",
+    "security issue",
+    "traceback",
+    "warning: ",
+    "warn: ",
+)
+
+# pytest output structure
+_PYTEST_DETAIL_RE = re.compile(r"^(.+\.py):(\d+):\s+in\s+(\w+)")
+_PYTEST_FAILED_TEST_RE = re.compile(r"FAILED\s+.+::(\w+)")
+_PYTEST_E_LINE_RE = re.compile(r"^E\s+")
+_EXCEPTION_LINE_RE = re.compile(r"^(AssertionError|Exception|.*Error):\s")
+_ATTRIBUTE_ERROR_RE = re.compile(r"AttributeError:\s*(.+)")
+_FAILURES_HEADER_RE = re.compile(r"=+\s*FAILURES\s*=+")
+_SECTION_HEADER_RE = re.compile(r"=+\s*(SHORT TEST SUMMARY|ERRORS|PASSED|FAILED)\s*=+")
+
 
 class GenericLogDetector(BaseFrameworkDetector):
     """Fallback detector for generic logs when no specific framework detected"""
@@ -129,6 +175,7 @@ class LogParser(BaseParser):
     """Parser for extracting errors and warnings from CI/CD logs"""
 
     # Enhanced error patterns - focus on actual failures including infrastructure issues
+    # Patterns are applied with search(), so none of them needs a leading "(.*)"
     ERROR_PATTERNS = [
         # CRITICAL: Job-ending failures that should ALWAYS be captured
         (r"SyntaxError: (.+)", "error"),  # Python syntax errors
@@ -147,31 +194,31 @@ class LogParser(BaseParser):
         (r"Failed to pull image (.+)", "error"),  # Image pull failures
         (r"exec user process caused (.+)", "error"),  # Container exec failures
         # Shell script errors that affect job execution
-        (r"(.*)not a valid identifier", "error"),
-        (r"(.*)command not found", "error"),
-        (r"(.*)No such file or directory", "error"),
-        (r"(.*)Permission denied", "error"),
+        (r"not a valid identifier", "error"),
+        (r"command not found", "error"),
+        (r"No such file or directory", "error"),
+        (r"Permission denied", "error"),
         # Test execution failures
         (r"^(.+\.py):(\d+):\s+in\s+(\w+)", "error"),  # pytest detailed format
-        (r"(.*)AssertionError: (.+)", "error"),
-        (r"(.*)assert (.+)", "error"),
-        (r"(.*)>.*assert (.+)", "error"),  # pytest assertion with > marker
-        (r"(.*)E\s+(.+Error: .+)", "error"),  # pytest error format with E prefix
-        (r"(.*)FAILED (.+test.*)", "error"),  # Test failures
-        (r"(.*)Test failed: (.+)", "error"),
+        (r"AssertionError: (.+)", "error"),
+        (r"assert (.+)", "error"),
+        (r">.*assert (.+)", "error"),  # pytest assertion with > marker
+        (r"E\s+(.+Error: .+)", "error"),  # pytest error format with E prefix
+        (r"FAILED (.+test.*)", "error"),  # Test failures
+        (r"Test failed: (.+)", "error"),
         # Build/compilation failures
-        (r"(.*)compilation error", "error"),
-        (r"(.*)build failed", "error"),
-        (r"(.*)fatal error: (.+)", "error"),
+        (r"compilation error", "error"),
+        (r"build failed", "error"),
+        (r"fatal error: (.+)", "error"),
         # Package/dependency errors that prevent job completion
-        (r"(.*)could not find", "error"),
-        (r"(.*)missing", "error"),
+        (r"could not find", "error"),
+        (r"missing", "error"),
         (r"ERROR: (.+)", "error"),  # Generic ERROR lines
         # Linting tool failures
-        (r"(.*)would reformat", "error"),  # black formatting issues
-        (r"(.*)Lint check failed", "error"),
-        (r"(.*)formatting.*issues", "error"),
-        (r"(.*)files would be reformatted", "error"),
+        (r"would reformat", "error"),  # black formatting issues
+        (r"Lint check failed", "error"),
+        (r"formatting.*issues", "error"),
+        (r"files would be reformatted", "error"),
         # Ruff linting errors - specific pattern for Ruff output
         (
             r"(.+\.py):(\d+):(\d+):\s+([A-Z]\d+)\s+\[?\*?\]?\s*(.+)",
@@ -182,7 +229,7 @@ class LogParser(BaseParser):
         (r"(.+) error.* fixable with", "error"),  # Ruff fixable errors summary
         # Import linting failures
         (r"No matches for ignored import (.+)", "error"),  # import-linter failures
-        (r"(.*)import.*not allowed", "error"),  # import policy violations
+        (r"import.*not allowed", "error"),  # import policy violations
         # Import-linter domain boundary violations (actual violations only)
         (
             r"^\s*-\s+(.+)\s+->\s+(.+)\s+\(l\.(\d+)\)",
@@ -206,23 +253,33 @@ class LogParser(BaseParser):
             r"make: \*\*\* \[(?!.*(?:test|check|format|lint))(.+)\] Error (\d+)",
             "error",
         ),  # make command failures (but not for testing/formatting/linting - those are tool status)
-        (r"(.*)make.*failed", "error"),  # general make failures
+        (r"make.*failed", "error"),  # general make failures
         # Security/vulnerability errors
-        (r"(.*)vulnerability", "error"),
-        (r"(.*)security issue", "error"),
+        (r"vulnerability", "error"),
+        (r"security issue", "error"),
         # Traceback start - often indicates real errors
-        (r"(.*)Traceback \(most recent call last\):", "error"),
+        (r"Traceback \(most recent call last\):", "error"),
     ]
 
     WARNING_PATTERNS = [
         # Code quality warnings
-        (r"(.*)DeprecationWarning: (.+)", "warning"),
-        (r"(.*)UserWarning: (.+)", "warning"),
-        (r"(.*)FutureWarning: (.+)", "warning"),
-        (r"(.*)WARNING: (.+)", "warning"),  # Will be filtered by excludes
-        (r"(.*)WARN: (.+)", "warning"),  # Will be filtered by excludes
+        (r"DeprecationWarning: (.+)", "warning"),
+        (r"UserWarning: (.+)", "warning"),
+        (r"FutureWarning: (.+)", "warning"),
+        (r"WARNING: (.+)", "warning"),  # Will be filtered by excludes
+        (r"WARN: (.+)", "warning"),  # Will be filtered by excludes
         # Linter warnings
-        (r"(.*)warning: (.+)", "warning"),
+        (r"warning: (.+)", "warning"),
+    ]
+
+    # Compile both tables once at class creation so the per-line loops in
+    # extract_log_entries only call .search() on ready pattern objects
+    _ERROR_REGEXES: list[tuple[re.Pattern[str], str]] = [
+        (re.compile(pattern, re.IGNORECASE), level) for pattern, level in ERROR_PATTERNS
+    ]
+    _WARNING_REGEXES: list[tuple[re.Pattern[str], str]] = [
+        (re.compile(pattern, re.IGNORECASE), level)
+        for pattern, level in WARNING_PATTERNS
     ]
 
     @classmethod
@@ -232,12 +289,12 @@ class LogParser(BaseParser):
         test_function = None
 
         # Format 1: "test/test_failures.py:10: in test_intentional_failure"
-        detailed_match = re.match(r"^(.+\.py):(\d+):\s+in\s+(\w+)", message)
+        detailed_match = _PYTEST_DETAIL_RE.match(message)
         if detailed_match:
             test_function = detailed_match.group(3)
 
         # Format 2: "FAILED test/test_failures.py::test_intentional_failure"
-        failed_match = re.search(r"FAILED\s+.+::(\w+)", message)
+        failed_match = _PYTEST_FAILED_TEST_RE.search(message)
         if failed_match:
             test_function = failed_match.group(1)
 
@@ -249,7 +306,7 @@ class LogParser(BaseParser):
         # Enhanced: Check for duplicate AttributeError messages in FAILED lines
         if "FAILED" in message and "AttributeError:" in message:
             # Extract the AttributeError message from the FAILED line
-            attr_error_match = re.search(r"AttributeError:\s*(.+)", message)
+            attr_error_match = _ATTRIBUTE_ERROR_RE.search(message)
             if attr_error_match:
                 attr_error_text = attr_error_match.group(1).strip()
                 # Check if we already have this exact AttributeError
@@ -310,12 +367,12 @@ class LogParser(BaseParser):
             line = lines[i].strip()
 
             # Found the start of FAILURES section
-            if re.match(r"=+\s*FAILURES\s*=+", line):
+            if _FAILURES_HEADER_RE.match(line):
                 failures_section_start = i
                 break
 
             # If we hit another pytest section, we're not in FAILURES
-            if re.match(r"=+\s*(SHORT TEST SUMMARY|ERRORS|PASSED|FAILED)\s*=+", line):
+            if _SECTION_HEADER_RE.match(line):
                 break
 
             # If we hit a clear job section boundary, stop looking
@@ -343,7 +400,7 @@ class LogParser(BaseParser):
             line = lines[i].strip()
 
             # Found end of FAILURES section (start of another section or summary)
-            if re.match(r"=+\s*(SHORT TEST SUMMARY|ERRORS|PASSED|FAILED)\s*=+", line):
+            if _SECTION_HEADER_RE.match(line):
                 failures_section_end = i
                 break
 
@@ -384,11 +441,19 @@ class LogParser(BaseParser):
             if not log_line:
                 continue
 
+            # Most lines carry no marker at all and cannot match any pattern
+            # below, so rule them out with plain substring checks first. Case
+            # folding is only equivalent to re.IGNORECASE for ASCII text.
+            if log_line.isascii():
+                lowered = log_line.lower()
+                if not any(marker in lowered for marker in _ENTRY_MARKERS):
+                    continue
+
+            # Built on first use and shared by every entry of this line
+            context: str | None = None
+
             # Skip GitLab CI infrastructure messages
-            if any(
-                re.search(pattern, log_line, re.IGNORECASE)
-                for pattern in cls.EXCLUDE_PATTERNS
-            ):
+            if any(regex.search(log_line) for regex in cls.EXCLUDE_REGEXES):
                 continue
 
             # Skip pytest error details (E   lines) and standalone exception messages
@@ -397,10 +462,10 @@ class LogParser(BaseParser):
             if (
                 line_num > 1
                 and (
-                    re.match(r"^E\s+", log_line)
+                    _PYTEST_E_LINE_RE.match(log_line)
                     or (
-                        re.match(r"^(AssertionError|Exception|.*Error):\s", log_line)
-                        and not re.match(r"^(.+\.py):(\d+):\s+in\s+(\w+)", log_line)
+                        _EXCEPTION_LINE_RE.match(log_line)
+                        and not _PYTEST_DETAIL_RE.match(log_line)
                         and "FAILED" not in log_line
                     )
                 )
@@ -410,17 +475,15 @@ class LogParser(BaseParser):
                 continue
 
             # Check for errors
-            for pattern, level in cls.ERROR_PATTERNS:
-                match = re.search(pattern, log_line, re.IGNORECASE)
+            for pattern, level in cls._ERROR_REGEXES:
+                match = pattern.search(log_line)
                 if match:
                     # Check for duplicate test errors
                     if cls._is_duplicate_test_error(log_line, entries):
                         break  # Skip this duplicate
 
                     # Special handling for pytest detailed format to avoid duplicates
-                    pytest_detail_match = re.match(
-                        r"^(.+\.py):(\d+):\s+in\s+(\w+)", log_line
-                    )
+                    pytest_detail_match = _PYTEST_DETAIL_RE.match(log_line)
                     if pytest_detail_match:
                         test_key = f"{pytest_detail_match.group(1)}:{pytest_detail_match.group(3)}"
                         if test_key in processed_pytest_details:
@@ -431,25 +494,13 @@ class LogParser(BaseParser):
                     actual_line_number = line_num  # Default to trace line number
 
                     # Look for Python file:line patterns in the current line or context
-                    file_line_patterns = [
-                        r'^\s*File\s+"([^"]+)",\s+line\s+(\d+)',  # Python traceback format
-                        r"^\s*([^:\s]+):(\d+):\s*in\s+",  # Ruby/pytest format
-                        r"^\s*([^:\s]+):(\d+):\s*",  # Generic file:line format
-                        r"^\s*([^:\s]+):\s*line\s+(\d+)",  # Alternative format
-                    ]
-
-                    for pattern in file_line_patterns:
-                        file_match = re.search(pattern, log_line)
-                        if file_match and len(file_match.groups()) >= 2:
+                    for file_line_re in _FILE_LINE_PATTERNS:
+                        file_match = file_line_re.search(log_line)
+                        if file_match:
                             # Prefer user code over system files
                             file_path = file_match.group(1)
                             if not any(
-                                sys_path in file_path
-                                for sys_path in [
-                                    "/root/.local/share/uv/python/",
-                                    "site-packages",
-                                    "/usr/lib",
-                                ]
+                                sys_path in file_path for sys_path in _SYSTEM_PATHS
                             ):
                                 try:
                                     actual_line_number = int(file_match.group(2))
@@ -459,20 +510,16 @@ class LogParser(BaseParser):
 
                     # If no line number found in current line, check context for user code
                     if actual_line_number == line_num:
-                        context_lines = cls._get_context(lines, line_num)
-                        for ctx_line in context_lines.split("\n"):
-                            for pattern in file_line_patterns:
-                                file_match = re.search(pattern, ctx_line)
-                                if file_match and len(file_match.groups()) >= 2:
+                        context = cls._get_context(lines, line_num)
+                        for ctx_line in context.split("\n"):
+                            for file_line_re in _FILE_LINE_PATTERNS:
+                                file_match = file_line_re.search(ctx_line)
+                                if file_match:
                                     file_path = file_match.group(1)
                                     # Prefer user code over system files
                                     if not any(
                                         sys_path in file_path
-                                        for sys_path in [
-                                            "/root/.local/share/uv/python/",
-                                            "site-packages",
-                                            "/usr/lib",
-                                        ]
+                                        for sys_path in _SYSTEM_PATHS
                                     ):
                                         try:
                                             actual_line_number = int(
@@ -484,45 +531,44 @@ class LogParser(BaseParser):
                             if actual_line_number != line_num:
                                 break
 
+                    if context is None:
+                        context = cls._get_context(lines, line_num)
+
                     entry = LogEntry(
                         level=level,
                         message=log_line,
                         line_number=actual_line_number,
-                        context=cls._get_context(lines, line_num),
+                        context=context,
                         error_type=cls.classify_error_type(log_line),
                     )
                     entries.append(entry)
                     break
 
             # Check for warnings
-            for pattern, level in cls.WARNING_PATTERNS:
-                match = re.search(pattern, log_line, re.IGNORECASE)
+            for pattern, level in cls._WARNING_REGEXES:
+                match = pattern.search(log_line)
                 if match:
                     # Extract actual Python file line number if available (same logic as errors)
                     actual_line_number = line_num  # Default to trace line number
 
                     # Look for Python file:line patterns
-                    file_line_patterns = [
-                        r'^\s*File\s+"([^"]+)",\s+line\s+(\d+)',  # Python traceback format
-                        r"^\s*([^:\s]+):(\d+):\s*in\s+",  # Ruby/pytest format
-                        r"^\s*([^:\s]+):(\d+):\s*",  # Generic file:line format
-                        r"^\s*([^:\s]+):\s*line\s+(\d+)",  # Alternative format
-                    ]
-
-                    for pattern_inner in file_line_patterns:
-                        file_match = re.search(pattern_inner, log_line)
-                        if file_match and len(file_match.groups()) >= 2:
+                    for file_line_re in _FILE_LINE_PATTERNS:
+                        file_match = file_line_re.search(log_line)
+                        if file_match:
                             try:
                                 actual_line_number = int(file_match.group(2))
                                 break
                             except (ValueError, IndexError):
                                 pass
 
+                    if context is None:
+                        context = cls._get_context(lines, line_num)
+
                     entry = LogEntry(
                         level=level,
                         message=log_line,
                         line_number=actual_line_number,
-                        context=cls._get_context(lines, line_num),
+                        context=context,
                         error_type=cls.classify_error_type(log_line),
                     )
                     entries.append(entry)
@@ -564,10 +610,7 @@ class LogParser(BaseParser):
             if (
                 not is_pytest_failure
             ):  # Only apply strict filtering for non-pytest content
-                if any(
-                    re.search(pattern, line, re.IGNORECASE)
-                    for pattern in cls.EXCLUDE_PATTERNS
-                ):
+                if any(regex.search(line) for regex in cls.EXCLUDE_REGEXES):
                     should_skip = True
             else:
                 # For pytest failures, only exclude the most obvious infrastructure noise
@@ -476,8 +476,7 @@ class PytestLogParser(BaseParser):
         filtered_lines = []
         for line in cleaned_log.split("\n"):
             if line.strip() and not any(
-                re.search(pattern, line, re.IGNORECASE)
-                for pattern in cls.EXCLUDE_PATTERNS
+                regex.search(line) for regex in cls.EXCLUDE_REGEXES
             ):
                 filtered_lines.append(line)
 
@@ -7,6 +7,7 @@ Licensed under the MIT License - see LICENSE file for details
 
 from .utils import (
     DEFAULT_EXCLUDE_PATHS,
+    close_gitlab_analyzer,
     combine_exclude_file_patterns,
     extract_file_path_from_message,
     get_gitlab_analyzer,
@@ -16,6 +17,7 @@ from .utils import (
 
 __all__ = [
     "DEFAULT_EXCLUDE_PATHS",
+    "close_gitlab_analyzer",
     "extract_file_path_from_message",
     "get_gitlab_analyzer",
     "get_mcp_info",
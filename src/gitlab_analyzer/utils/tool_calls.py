@@ -0,0 +1,46 @@
+"""
+Helpers shared by the MCP client scripts and examples for calling tools
+
+Copyright (c) 2025 Siarhei Skuratovich
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import asyncio
+import os
+from collections.abc import Callable
+from typing import Any
+
+# Prefer the fastest available decoder: orjson, then ujson, then the stdlib
+json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        json_loads = ujson.loads
+    except ImportError:
+        import json
+
+        json_loads = json.loads
+
+# Upper bound in seconds for a single tool call so a stuck server cannot hang
+# the run; MCP_TOOL_TIMEOUT overrides it and 0 disables the limit
+TOOL_CALL_TIMEOUT = float(os.environ.get("MCP_TOOL_TIMEOUT", "30"))
+
+
+async def safe_call(
+    client: Any,
+    name: str,
+    arguments: dict[str, Any],
+    timeout: float = TOOL_CALL_TIMEOUT,
+) -> Any:
+    """Call an MCP tool, returning an error dict if it does not finish in time"""
+    try:
+        return await asyncio.wait_for(
+            client.call_tool(name, arguments), timeout or None
+        )
+    except asyncio.TimeoutError:
+        return {"error": f"{name} timed out after {timeout:g}s"}
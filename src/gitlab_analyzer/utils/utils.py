@@ -49,12 +49,17 @@ def get_mcp_info(
 
 
 def get_gitlab_analyzer() -> GitLabAnalyzer:
-    """Get or create GitLab analyzer instance"""
+    """
+    Get or create GitLab analyzer instance
+
+    The token is only read and validated here, on first use, so importing
+    the package or creating the server does not require GitLab credentials.
+    """
     global _GITLAB_ANALYZER  # pylint: disable=global-statement
 
     if _GITLAB_ANALYZER is None:
         gitlab_url = os.getenv("GITLAB_URL", "https://gitlab.com")
-        gitlab_token = os.getenv("GITLAB_TOKEN")
+        gitlab_token = os.getenv("GITLAB_TOKEN", "").strip()
 
         if not gitlab_token:
             raise ValueError("GITLAB_TOKEN environment variable is required")
@@ -64,6 +69,12 @@ def get_gitlab_analyzer() -> GitLabAnalyzer:
     return _GITLAB_ANALYZER
 
 
+async def close_gitlab_analyzer() -> None:
+    """Close the HTTP connections of the GitLab analyzer, if one was created"""
+    if _GITLAB_ANALYZER is not None:
+        await _GITLAB_ANALYZER.aclose()
+
+
 def _is_test_job(job_name: str, job_stage: str) -> bool:
     """
     Detect if a job is a test job based on its name and stage.
@@ -167,3 +167,13 @@ def clean_global_analyzer(monkeypatch):
     import gitlab_analyzer.utils.utils
 
     monkeypatch.setattr(gitlab_analyzer.utils.utils, "_GITLAB_ANALYZER", None)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """Reset the in-memory trace parse cache so mocked parsers do not leak"""
+    from gitlab_analyzer.mcp.tools import job_analysis_tools
+
+    job_analysis_tools._PARSE_CACHE.clear()
+    yield
+    job_analysis_tools._PARSE_CACHE.clear()
@@ -4,9 +4,15 @@ Tests for src/gitlab_analyzer/core/analysis.py
 This module tests the core analysis functions that handle pipeline failure investigation.
 """
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
 import pytest
 
 from gitlab_analyzer.core.analysis import (
+    MAX_CONCURRENT_JOB_ANALYSES,
+    analyze_pipeline_jobs,
     get_optimal_parser,
     is_pytest_job,
 )
@@ -68,6 +74,17 @@ class TestIsPytestJob:
         )
         assert result is True
 
+    def test_is_pytest_job_trace_markers_ignore_case(self):
+        """Test trace detection through the lowercase literal fast path."""
+        assert is_pytest_job("compile", "", "==== FAILURES ====") is True
+        assert is_pytest_job("compile", "", "RUFF CHECK FAILED") is False
+        assert is_pytest_job("compile", "", "npm install\nbuild ok") is False
+
+    def test_is_pytest_job_non_ascii_trace(self):
+        """Test that non-ASCII traces still go through the regex scan."""
+        # "ſ" folds to "s" under re.IGNORECASE but is unchanged by str.lower()
+        assert is_pytest_job("compile", "", "uv run pyteſt ✓") is True
+
 
 class TestGetOptimalParser:
     """Test the get_optimal_parser function."""
@@ -142,3 +159,99 @@ class TestAnalysisIntegration:
             job_name="build-app", job_stage="build", trace_content=sample_trace_content
         )
         assert parser_type == "pytest"
+
+
+class TestAnalyzePipelineJobs:
+    """Test the analyze_pipeline_jobs function."""
+
+    @pytest.mark.asyncio
+    async def test_traces_fetched_concurrently_in_job_order(self):
+        """Test that traces are fetched concurrently and results keep job order."""
+        jobs = [
+            SimpleNamespace(
+                id=job_id, name=f"build-{job_id}", stage="build", status="failed"
+            )
+            for job_id in range(1, MAX_CONCURRENT_JOB_ANALYSES + 3)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_job_trace(project_id, job_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (len(jobs) - job_id))
+            in_flight -= 1
+            if job_id == 2:
+                raise RuntimeError("trace unavailable")
+            return "ERROR: build failed"
+
+        analyzer = Mock()
+        analyzer.get_pipeline = AsyncMock(return_value={"status": "failed"})
+        analyzer.get_pipeline_jobs = AsyncMock(return_value=jobs)
+        analyzer.get_job_trace = get_job_trace
+
+        result = await analyze_pipeline_jobs(analyzer, "123", 456)
+
+        assert max_in_flight == MAX_CONCURRENT_JOB_ANALYSES
+        assert [job["job_id"] for job in result["analyzed_jobs"]] == [
+            job.id for job in jobs
+        ]
+        failed_job = result["analyzed_jobs"][1]["analysis"]
+        assert failed_job == {
+            "error": "Failed to analyze job: trace unavailable",
+            "parser_type": "error",
+        }
+        assert result["analysis_summary"]["error_jobs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_jobs_stored_as_they_finish_one_at_a_time(self):
+        """Test that each job is stored once analyzed, never two at once."""
+        jobs = [
+            SimpleNamespace(id=1, name="build-slow", stage="build", status="failed"),
+            SimpleNamespace(id=2, name="build-fast", stage="build", status="failed"),
+            SimpleNamespace(id=3, name="build-fast", stage="build", status="failed"),
+        ]
+        slow_trace_released = asyncio.Event()
+        stored_before_slow_trace = []
+        storing = 0
+        max_storing = 0
+
+        async def get_job_trace(project_id, job_id):
+            if job_id == 1:
+                await slow_trace_released.wait()
+            return "ERROR: build failed"
+
+        async def store_job_analysis_step(
+            cache_manager, project_id, pipeline_id, job_id, *args
+        ):
+            nonlocal storing, max_storing
+            storing += 1
+            max_storing = max(max_storing, storing)
+            await asyncio.sleep(0.01)
+            storing -= 1
+            if not slow_trace_released.is_set():
+                stored_before_slow_trace.append(job_id)
+                if len(stored_before_slow_trace) == 2:
+                    slow_trace_released.set()
+
+        analyzer = Mock()
+        analyzer.get_pipeline = AsyncMock(return_value={"status": "failed"})
+        analyzer.get_pipeline_jobs = AsyncMock(return_value=jobs)
+        analyzer.get_job_trace = get_job_trace
+
+        with (
+            patch("gitlab_analyzer.core.analysis.store_jobs_metadata_step"),
+            patch(
+                "gitlab_analyzer.core.analysis.store_job_analysis_step",
+                new=store_job_analysis_step,
+            ),
+        ):
+            result = await asyncio.wait_for(
+                analyze_pipeline_jobs(analyzer, "123", 456, cache_manager=Mock()),
+                timeout=5,
+            )
+
+        assert sorted(stored_before_slow_trace) == [2, 3]
+        assert max_storing == 1
+        assert [job["job_id"] for job in result["analyzed_jobs"]] == [1, 2, 3]
@@ -280,3 +280,13 @@ section_end:1641234567:step_script\r\x1b[0K"""
         assert "at line 42" in result
         assert "Expected: 5" in result
         assert "Actual: 3" in result
+
+    def test_exclude_regexes_match_exclude_patterns(self):
+        """Test that the compiled exclusions mirror EXCLUDE_PATTERNS."""
+        assert [regex.pattern for regex in BaseParser.EXCLUDE_REGEXES] == list(
+            BaseParser.EXCLUDE_PATTERNS
+        )
+        assert any(
+            regex.search("RUNNING WITH GITLAB-RUNNER 16.0")
+            for regex in BaseParser.EXCLUDE_REGEXES
+        )
@@ -69,6 +69,7 @@ class TestCleanTraceToolsFocused:
         assert isinstance(result, dict)
         assert "clean_trace" in result or "trace_content" in result
         mock_analyzer.get_job_trace.assert_called_with("123", 456)
+        assert result["trace_lines"] == 1
 
     @patch("gitlab_analyzer.mcp.tools.clean_trace_tools.get_gitlab_analyzer")
     def test_get_clean_job_trace_json_format(self, mock_get_analyzer):
@@ -238,6 +238,68 @@ class TestCodeReviewIntegration:
                         assert result["mr_review_summary"] == mock_review_summary
                         assert result["pipeline_type"] == "merge_request"
 
+    @pytest.mark.asyncio
+    async def test_pipeline_info_review_summary_failure(self, analyzer):
+        """Test that a failed review summary does not discard the MR overview"""
+        import httpx
+
+        mock_mr_overview = {"iid": 123, "title": "Fix authentication bug"}
+
+        with (
+            patch.object(
+                analyzer, "get_pipeline", new_callable=AsyncMock
+            ) as mock_pipeline,
+            patch.object(
+                analyzer, "get_merge_request", new_callable=AsyncMock
+            ) as mock_mr,
+            patch.object(
+                analyzer, "get_merge_request_overview", new_callable=AsyncMock
+            ) as mock_overview,
+            patch.object(
+                analyzer, "get_merge_request_review_summary", new_callable=AsyncMock
+            ) as mock_review,
+        ):
+            mock_pipeline.return_value = {"ref": "refs/merge-requests/123/head"}
+            mock_mr.return_value = {"source_branch": "feature/fix-auth"}
+            mock_overview.return_value = mock_mr_overview
+            mock_review.side_effect = httpx.HTTPError("API Error")
+
+            result = await get_comprehensive_pipeline_info(analyzer, 83, 1594344)
+
+        assert result["mr_overview"] == mock_mr_overview
+        assert "Failed to get review summary" in result["mr_review_summary"]["error"]
+        assert result["can_auto_fix"] is True
+
+    @pytest.mark.asyncio
+    async def test_pipeline_info_overview_failure(self, analyzer):
+        """Test that the review summary is dropped when the MR overview fails"""
+        import httpx
+
+        with (
+            patch.object(
+                analyzer, "get_pipeline", new_callable=AsyncMock
+            ) as mock_pipeline,
+            patch.object(
+                analyzer, "get_merge_request", new_callable=AsyncMock
+            ) as mock_mr,
+            patch.object(
+                analyzer, "get_merge_request_overview", new_callable=AsyncMock
+            ) as mock_overview,
+            patch.object(
+                analyzer, "get_merge_request_review_summary", new_callable=AsyncMock
+            ) as mock_review,
+        ):
+            mock_pipeline.return_value = {"ref": "refs/merge-requests/123/head"}
+            mock_mr.return_value = {"source_branch": "feature/fix-auth"}
+            mock_overview.side_effect = httpx.HTTPError("API Error")
+            mock_review.return_value = {"review_comments": []}
+
+            result = await get_comprehensive_pipeline_info(analyzer, 83, 1594344)
+
+        assert "Failed to get MR overview" in result["mr_overview"]["error"]
+        assert result["mr_review_summary"] is None
+        assert result["target_branch"] == "feature/fix-auth"
+
     @pytest.mark.asyncio
     async def test_review_summary_handles_api_errors(self, analyzer):
         """Test that review summary gracefully handles API errors"""
@@ -5,6 +5,7 @@ Copyright (c) 2025 Siarhei Skuratovich
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -52,14 +53,12 @@ class TestGitLabAnalyzer:
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_pipeline("test-project", 12345)
 
             assert result == mock_response_data
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
+            mock_client.return_value.get.assert_called_once_with(
                 "https://gitlab.example.com/api/v4/projects/test-project/pipelines/12345",
                 headers=self.analyzer.headers,
             )
@@ -73,9 +72,7 @@ class TestGitLabAnalyzer:
                 "404 Not Found", request=Mock(), response=Mock()
             )
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             with pytest.raises(httpx.HTTPStatusError):
                 await self.analyzer.get_pipeline("test-project", 12345)
@@ -102,9 +99,7 @@ class TestGitLabAnalyzer:
             mock_response.json.return_value = mock_jobs_data
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_pipeline_jobs("test-project", 12345)
 
@@ -136,9 +131,7 @@ class TestGitLabAnalyzer:
             mock_response.json.return_value = mock_jobs_data
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_failed_pipeline_jobs("test-project", 12345)
 
@@ -161,18 +154,106 @@ class TestGitLabAnalyzer:
             mock_response.text = mock_trace
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_job_trace("test-project", 1001)
 
             assert result == mock_trace
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
+            mock_client.return_value.get.assert_called_once_with(
                 "https://gitlab.example.com/api/v4/projects/test-project/jobs/1001/trace",
                 headers=self.analyzer.headers,
+                timeout=60.0,
             )
 
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self):
+        """Test that consecutive requests share one pooled HTTP client"""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.json.return_value = {"id": 123}
+            mock_response.raise_for_status.return_value = None
+
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock(return_value=None)
+
+            await self.analyzer.get_pipeline("test-project", 123)
+            await self.analyzer.get_pipeline("test-project", 124)
+
+            mock_client.assert_called_once_with(timeout=30.0)
+            assert mock_client.return_value.get.call_count == 2
+
+            await self.analyzer.aclose()
+
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_http_client_replaced_when_event_loop_changes(self):
+        """Test that the previous client is closed when a new one is opened"""
+        old_client = Mock()
+        old_client.aclose = AsyncMock(return_value=None)
+        self.analyzer._client = old_client
+        self.analyzer._client_loop = Mock(is_closed=Mock(return_value=False))
+
+        with patch("httpx.AsyncClient") as mock_client:
+            client = await self.analyzer._get_client()
+
+        old_client.aclose.assert_awaited_once()
+        assert client is mock_client.return_value
+
+    @pytest.mark.asyncio
+    async def test_http_client_not_duplicated_while_old_one_closes(self):
+        """Test that callers entering during the old client's close share the new one"""
+        close_started = asyncio.Event()
+        release_close = asyncio.Event()
+
+        async def slow_aclose():
+            close_started.set()
+            await release_close.wait()
+
+        old_client = Mock()
+        old_client.aclose = slow_aclose
+        self.analyzer._client = old_client
+        self.analyzer._client_loop = Mock(is_closed=Mock(return_value=False))
+
+        with patch(
+            "httpx.AsyncClient", side_effect=lambda **kwargs: Mock()
+        ) as mock_client:
+            first = asyncio.ensure_future(self.analyzer._get_client())
+            await close_started.wait()
+            second = await self.analyzer._get_client()
+            release_close.set()
+
+            assert await first is second
+        assert mock_client.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_skips_client_of_closed_event_loop(self):
+        """Test that a client whose event loop is gone is dropped, not closed"""
+        old_client = Mock()
+        old_client.aclose = AsyncMock(return_value=None)
+        self.analyzer._client = old_client
+        self.analyzer._client_loop = Mock(is_closed=Mock(return_value=True))
+
+        await self.analyzer.aclose()
+
+        old_client.aclose.assert_not_awaited()
+        assert self.analyzer._client is None
+
+    @pytest.mark.asyncio
+    async def test_close_gitlab_analyzer(self):
+        """Test that the shared analyzer's client is closed on shutdown"""
+        import gitlab_analyzer.utils.utils as utils_module
+
+        with (
+            patch.object(utils_module, "_GITLAB_ANALYZER", self.analyzer),
+            patch.object(
+                self.analyzer, "aclose", new=AsyncMock(return_value=None)
+            ) as mock_aclose,
+        ):
+            await utils_module.close_gitlab_analyzer()
+
+        mock_aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_timeout_configuration(self):
         """Test that HTTP client is configured with correct timeout"""
@@ -181,9 +262,7 @@ class TestGitLabAnalyzer:
             mock_response.json.return_value = {}
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             await self.analyzer.get_pipeline("test-project", 12345)
 
@@ -213,9 +292,7 @@ class TestGitLabAnalyzer:
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_job_info("test-project", 1001)
 
@@ -223,7 +300,7 @@ class TestGitLabAnalyzer:
             assert result["id"] == 1001
             assert result["name"] == "test-job"
             assert result["status"] == "failed"
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
+            mock_client.return_value.get.assert_called_once_with(
                 "https://gitlab.example.com/api/v4/projects/test-project/jobs/1001",
                 headers=self.analyzer.headers,
             )
@@ -235,14 +312,12 @@ class TestGitLabAnalyzer:
             mock_response = Mock()
             mock_response.status_code = 404
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             result = await self.analyzer.get_job_info("test-project", 9999)
 
             assert result is None
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
+            mock_client.return_value.get.assert_called_once_with(
                 "https://gitlab.example.com/api/v4/projects/test-project/jobs/9999",
                 headers=self.analyzer.headers,
             )
@@ -257,9 +332,7 @@ class TestGitLabAnalyzer:
                 "Server Error", request=Mock(), response=mock_response
             )
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             with pytest.raises(httpx.HTTPStatusError):
                 await self.analyzer.get_job_info("test-project", 1001)
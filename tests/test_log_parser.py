@@ -6,7 +6,7 @@ Licensed under the MIT License - see LICENSE file for details
 """
 
 from gitlab_analyzer.models import LogEntry
-from gitlab_analyzer.parsers.log_parser import LogParser
+from gitlab_analyzer.parsers.log_parser import _ENTRY_MARKERS, LogParser
 
 
 class TestLogParser:
@@ -384,3 +384,73 @@ class TestLogParserEdgeCases:
         assert "message" in entry_dict
         assert "line_number" in entry_dict
         assert "timestamp" in entry_dict
+
+
+class TestLogParserMarkerPrefilter:
+    """Test the substring prefilter in front of the pattern tables."""
+
+    SAMPLE_LINES = [
+        "SyntaxError: invalid syntax",
+        "ModuleNotFoundError: No module named 'foo'",
+        "Error response from daemon: manifest unknown",
+        "docker: invalid reference format",
+        "Failed to pull image alpine",
+        'exec user process caused "exec format error"',
+        "export: `1x': not a valid identifier",
+        "bash: pytest: command not found",
+        "cat: config.yml: No such file or directory",
+        "Permission denied (publickey)",
+        "tests/test_app.py:12: in test_login",
+        ">       assert result == 2",
+        "E       ValueError: boom",
+        "FAILED tests/test_app.py::test_login",
+        "Test failed: login",
+        "compilation error in main.c",
+        "BUILD FAILED",
+        "main.c:1:10: fatal error: stdio.h: not found",
+        "could not find a version that satisfies",
+        "Missing required argument",
+        "would reformat src/app.py",
+        "Lint check failed",
+        "formatting issues in 2 files",
+        "src/app.py:1:1: F401 [*] `os` imported but unused",
+        "3 errors fixable with the `--fix` option",
+        "No matches for ignored import app.models",
+        "import of app.db not allowed",
+        "- app/views.py -> app.db (l.12)",
+        "app.serializers -> users (l.3)",
+        "make: *** [build] Error 2",
+        "make[1]: target failed",
+        "vulnerability found in requests",
+        "security issue detected",
+        "Traceback (most recent call last):",
+        "DeprecationWarning: use something else",
+        "WARN: retrying",
+        "warning: unused variable",
+    ]
+
+    def test_every_pattern_match_contains_a_marker(self):
+        """Test that lines matched by the pattern tables pass the prefilter"""
+        patterns = [
+            pattern
+            for pattern, _ in LogParser._ERROR_REGEXES + LogParser._WARNING_REGEXES
+        ]
+
+        for line in self.SAMPLE_LINES:
+            assert any(pattern.search(line) for pattern in patterns), line
+            lowered = line.lower()
+            assert any(marker in lowered for marker in _ENTRY_MARKERS), line
+
+    def test_unmarked_lines_are_skipped(self):
+        """Test that lines without any marker produce no entries"""
+        log_content = "Step 1/4 : FROM python:3.12\nadded 120 packages in 3s\n"
+
+        assert LogParser.extract_log_entries(log_content) == []
+
+    def test_non_ascii_line_still_matched(self):
+        """Test that non-ASCII lines bypass the prefilter"""
+        result = LogParser.extract_log_entries("İmportError: cannot import name")
+
+        assert [entry.message for entry in result] == [
+            "İmportError: cannot import name"
+        ]
@@ -40,9 +40,7 @@ async def test_search_project_code():
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         results = await client.search_project_code(
             project_id=123, search_term="async def", extension_filter="py"
@@ -64,9 +62,7 @@ async def test_search_project_code_with_filters():
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         await client.search_project_code(
             project_id=123,
@@ -78,7 +74,7 @@ async def test_search_project_code_with_filters():
         )
 
         # Verify the call was made with correct parameters
-        call_args = mock_client.return_value.__aenter__.return_value.get.call_args
+        call_args = mock_client.return_value.get.call_args
         assert call_args[1]["params"]["scope"] == "blobs"
         assert (
             call_args[1]["params"]["search"]
@@ -110,9 +106,7 @@ async def test_search_project_commits():
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         results = await client.search_project_commits(
             project_id=123, search_term="fix bug"
@@ -134,16 +128,14 @@ async def test_search_project_commits_with_branch():
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         await client.search_project_commits(
             project_id=123, search_term="merge", branch="main"
         )
 
         # Verify the call was made with correct parameters
-        call_args = mock_client.return_value.__aenter__.return_value.get.call_args
+        call_args = mock_client.return_value.get.call_args
         assert call_args[1]["params"]["scope"] == "commits"
         assert call_args[1]["params"]["search"] == "merge"
         assert call_args[1]["params"]["ref"] == "main"
@@ -158,9 +150,7 @@ async def test_search_error_handling():
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = Exception("API Error")
 
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(Exception, match="API Error"):
             await client.search_project_code(project_id=123, search_term="test")
@@ -0,0 +1,86 @@
+"""
+Tests for .env loading in the MCP server entry point
+
+Copyright (c) 2025 Siarhei Skuratovich
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from gitlab_analyzer.mcp.servers import server
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache(monkeypatch):
+    """Reset the parsed .env cache and required variables between tests"""
+    for key in server.REQUIRED_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+    server._ENV_CACHE.clear()
+    yield
+    server._ENV_CACHE.clear()
+
+
+class TestLoadEnvFile:
+    """Test .env file loading"""
+
+    def test_loads_variables(self, tmp_path, monkeypatch):
+        """Test that KEY=VALUE pairs are exported to the environment"""
+        monkeypatch.delenv("TEST_ENV_ALPHA", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("# comment\n\nTEST_ENV_ALPHA=one=two\n", encoding="utf-8")
+
+        server.load_env_file(env_file)
+
+        assert os.environ["TEST_ENV_ALPHA"] == "one=two"
+
+    def test_missing_file_is_ignored(self, tmp_path):
+        """Test that a missing .env file is a no-op"""
+        server.load_env_file(tmp_path / "missing.env")
+
+        assert server._ENV_CACHE == {}
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        """Test that the parsed file is reused while its mtime is unchanged"""
+        monkeypatch.delenv("TEST_ENV_BETA", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("TEST_ENV_BETA=1\n", encoding="utf-8")
+
+        with patch.object(
+            server, "parse_env_file", wraps=server.parse_env_file
+        ) as mock_parse:
+            server.load_env_file(env_file)
+            server.load_env_file(env_file)
+
+        mock_parse.assert_called_once()
+        assert os.environ["TEST_ENV_BETA"] == "1"
+
+    def test_modified_file_is_reparsed(self, tmp_path, monkeypatch):
+        """Test that a change in mtime invalidates the cached contents"""
+        monkeypatch.delenv("TEST_ENV_GAMMA", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("TEST_ENV_GAMMA=old\n", encoding="utf-8")
+        server.load_env_file(env_file)
+
+        env_file.write_text("TEST_ENV_GAMMA=new\n", encoding="utf-8")
+        mtime = env_file.stat().st_mtime + 10
+        os.utime(env_file, (mtime, mtime))
+        server.load_env_file(env_file)
+
+        assert os.environ["TEST_ENV_GAMMA"] == "new"
+
+    def test_skipped_when_required_vars_set(self, tmp_path, monkeypatch):
+        """Test that the file is not read when GitLab variables are exported"""
+        monkeypatch.setenv("GITLAB_URL", "https://gitlab.example.com")
+        monkeypatch.setenv("GITLAB_TOKEN", "token")
+        monkeypatch.delenv("TEST_ENV_DELTA", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("TEST_ENV_DELTA=1\n", encoding="utf-8")
+
+        with patch.object(server, "parse_env_file") as mock_parse:
+            server.load_env_file(env_file)
+
+        mock_parse.assert_not_called()
+        assert "TEST_ENV_DELTA" not in os.environ
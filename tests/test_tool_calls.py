@@ -0,0 +1,50 @@
+"""
+Tests for the tool call helpers shared by the MCP client scripts
+
+Copyright (c) 2025 Siarhei Skuratovich
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gitlab_analyzer.utils.tool_calls import json_loads, safe_call
+
+
+class TestSafeCall:
+    """Test safe_call"""
+
+    @pytest.mark.asyncio
+    async def test_returns_tool_result(self):
+        """Test that a call finishing in time returns the tool result"""
+        client = Mock()
+        client.call_tool = AsyncMock(return_value={"status": "failed"})
+
+        result = await safe_call(client, "get_pipeline_status", {"id": 1}, 1)
+
+        assert result == {"status": "failed"}
+        client.call_tool.assert_awaited_once_with("get_pipeline_status", {"id": 1})
+
+    @pytest.mark.asyncio
+    async def test_returns_error_on_timeout(self):
+        """Test that a stuck call is abandoned with an error dict"""
+
+        async def call_tool(name, arguments):
+            await asyncio.sleep(10)
+
+        client = Mock(call_tool=call_tool)
+
+        result = await safe_call(client, "get_job_trace", {}, 0.01)
+
+        assert result == {"error": "get_job_trace timed out after 0.01s"}
+
+
+class TestJsonLoads:
+    """Test json_loads"""
+
+    def test_decodes_text_and_bytes(self):
+        """Test that whichever decoder is installed accepts str and bytes"""
+        assert json_loads('{"a": 1}') == {"a": 1}
+        assert json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
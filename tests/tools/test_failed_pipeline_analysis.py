@@ -5,11 +5,14 @@ Copyright (c) 2025 Siarhei Skuratovich
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from gitlab_analyzer.mcp.tools import job_analysis_tools
 from gitlab_analyzer.mcp.tools.failed_pipeline_analysis import (
+    MAX_CONCURRENT_TRACE_FETCHES,
     register_failed_pipeline_analysis_tools,
 )
 
@@ -160,6 +163,176 @@ class TestFailedPipelineAnalysisTools:
         # Verify job traces were retrieved
         assert mock_analyzer.get_job_trace.call_count == 2  # For both failed jobs
 
+    @patch(
+        "gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_comprehensive_pipeline_info"
+    )
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_cache_manager")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_gitlab_analyzer")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_mcp_info")
+    async def test_failed_pipeline_analysis_fetches_traces_concurrently(
+        self,
+        mock_get_mcp_info,
+        mock_get_analyzer,
+        mock_get_cache_manager,
+        mock_get_pipeline_info,
+        mock_cache_manager,
+        mock_analyzer,
+        mock_pipeline_info,
+        mock_mcp,
+    ):
+        """Test that traces are fetched in parallel, bounded, and kept per job"""
+        jobs = []
+        for job_id in range(200, 212):
+            job = Mock()
+            job.id = job_id
+            job.name = f"build-job-{job_id}"
+            job.stage = "build"
+            job.status = "failed"
+            jobs.append(job)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_job_trace(project_id, job_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"Error: build {job_id} failed"
+
+        mock_analyzer.get_failed_pipeline_jobs = AsyncMock(return_value=jobs)
+        mock_analyzer.get_job_trace = AsyncMock(side_effect=get_job_trace)
+        mock_get_analyzer.return_value = mock_analyzer
+        mock_get_cache_manager.return_value = mock_cache_manager
+        mock_get_pipeline_info.return_value = mock_pipeline_info
+        mock_get_mcp_info.return_value = {"tool": "failed_pipeline_analysis"}
+
+        register_failed_pipeline_analysis_tools(mock_mcp)
+        analysis_func = mock_mcp.tool.call_args_list[0][0][0]
+
+        with patch(
+            "gitlab_analyzer.mcp.tools.job_analysis_tools.analyze_job_trace",
+            new=AsyncMock(return_value={"errors": [], "parser_type": "generic"}),
+        ) as mock_analyze:
+            await analysis_func(
+                project_id="test-project", pipeline_id=456, store_in_db=False
+            )
+
+        assert mock_analyzer.get_job_trace.call_count == len(jobs)
+        assert 1 < max_in_flight <= MAX_CONCURRENT_TRACE_FETCHES
+        for call in mock_analyze.call_args_list:
+            kwargs = call.kwargs
+            assert kwargs["trace_content"] == f"Error: build {kwargs['job_id']} failed"
+
+    @patch(
+        "gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_comprehensive_pipeline_info"
+    )
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_cache_manager")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_gitlab_analyzer")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_mcp_info")
+    async def test_failed_pipeline_analysis_skips_trace_of_parsed_job(
+        self,
+        mock_get_mcp_info,
+        mock_get_analyzer,
+        mock_get_cache_manager,
+        mock_get_pipeline_info,
+        mock_cache_manager,
+        mock_analyzer,
+        mock_pipeline_info,
+        mock_mcp,
+    ):
+        """Test that finished jobs with a cached parse are not downloaded again"""
+        job = Mock()
+        job.id = 400
+        job.name = "build-job"
+        job.stage = "build"
+        job.status = "failed"
+        job_analysis_tools._PARSE_CACHE[
+            job_analysis_tools._parse_cache_key(
+                "test-project", job.id, job.name, job.stage, None
+            )
+        ] = (0, {"errors": [], "parser_type": "generic"})
+
+        mock_analyzer.get_failed_pipeline_jobs = AsyncMock(return_value=[job])
+        mock_analyzer.get_job_trace = AsyncMock(return_value="Error: build failed")
+        mock_get_analyzer.return_value = mock_analyzer
+        mock_get_cache_manager.return_value = mock_cache_manager
+        mock_get_pipeline_info.return_value = mock_pipeline_info
+        mock_get_mcp_info.return_value = {"tool": "failed_pipeline_analysis"}
+
+        register_failed_pipeline_analysis_tools(mock_mcp)
+        analysis_func = mock_mcp.tool.call_args_list[0][0][0]
+
+        with patch(
+            "gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager",
+            return_value=mock_cache_manager,
+        ):
+            await analysis_func(
+                project_id="test-project", pipeline_id=456, store_in_db=False
+            )
+
+        mock_analyzer.get_job_trace.assert_not_called()
+
+    @patch(
+        "gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_comprehensive_pipeline_info"
+    )
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_cache_manager")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_gitlab_analyzer")
+    @patch("gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_mcp_info")
+    async def test_failed_pipeline_analysis_cancels_pending_trace_fetches(
+        self,
+        mock_get_mcp_info,
+        mock_get_analyzer,
+        mock_get_cache_manager,
+        mock_get_pipeline_info,
+        mock_cache_manager,
+        mock_analyzer,
+        mock_pipeline_info,
+        mock_mcp,
+    ):
+        """Test that outstanding trace fetches are cancelled when a job fails"""
+        jobs = []
+        for job_id in range(300, 304):
+            job = Mock()
+            job.id = job_id
+            job.name = f"build-job-{job_id}"
+            job.stage = "build"
+            job.status = "failed"
+            jobs.append(job)
+
+        cancelled = []
+
+        async def get_job_trace(project_id, job_id):
+            if job_id == 300:
+                return "Error: build failed"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(job_id)
+                raise
+            return "Error: build failed"
+
+        mock_analyzer.get_failed_pipeline_jobs = AsyncMock(return_value=jobs)
+        mock_analyzer.get_job_trace = AsyncMock(side_effect=get_job_trace)
+        mock_get_analyzer.return_value = mock_analyzer
+        mock_get_cache_manager.return_value = mock_cache_manager
+        mock_get_pipeline_info.return_value = mock_pipeline_info
+        mock_get_mcp_info.return_value = {"tool": "failed_pipeline_analysis"}
+
+        register_failed_pipeline_analysis_tools(mock_mcp)
+        analysis_func = mock_mcp.tool.call_args_list[0][0][0]
+
+        with patch(
+            "gitlab_analyzer.mcp.tools.job_analysis_tools.analyze_job_trace",
+            new=AsyncMock(side_effect=RuntimeError("analysis failed")),
+        ):
+            await analysis_func(
+                project_id="test-project", pipeline_id=456, store_in_db=False
+            )
+
+        assert sorted(cancelled) == [301, 302, 303]
+
     @patch(
         "gitlab_analyzer.mcp.tools.failed_pipeline_analysis.get_comprehensive_pipeline_info"
     )
@@ -9,7 +9,11 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from gitlab_analyzer.mcp.tools.job_analysis_tools import register_job_analysis_tools
+from gitlab_analyzer.mcp.tools import job_analysis_tools
+from gitlab_analyzer.mcp.tools.job_analysis_tools import (
+    analyze_job_trace,
+    register_job_analysis_tools,
+)
 
 
 class TestJobAnalysisTools:
@@ -474,3 +478,114 @@ class TestJobAnalysisTools:
             assert any(
                 "gl://pipeline/test-project/12345" in uri for uri in resource_uris
             )
+
+
+class TestAnalyzeJobTraceParseCache:
+    """Test reuse of parse results for finished jobs"""
+
+    PARSED = {
+        "parser_type": "generic",
+        "errors": [{"message": "Error: build failed", "line_number": 3}],
+        "error_count": 1,
+        "warning_count": 0,
+    }
+
+    async def _analyze(
+        self,
+        trace: str | None = "Error: build failed",
+        job_id: int = 1001,
+        job_status: str = "failed",
+    ) -> dict:
+        return await analyze_job_trace(
+            project_id="test-project",
+            job_id=job_id,
+            trace_content=trace,
+            job_name="build",
+            job_stage="build",
+            store_in_db=False,
+            job_status=job_status,
+        )
+
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager")
+    @patch("gitlab_analyzer.core.analysis.parse_job_logs")
+    async def test_finished_job_is_parsed_once(self, mock_parse, _mock_cache):
+        """Test that a repeated analysis of a finished job skips the parsers"""
+        mock_parse.return_value = self.PARSED
+
+        first = await self._analyze()
+        assert job_analysis_tools.is_job_parse_cached(
+            "test-project", 1001, "build", "build", None, "failed"
+        )
+        second = await self._analyze(trace=None)
+
+        mock_parse.assert_called_once()
+        assert first == second
+        assert second["total_errors"] == 1
+        assert second["parsing_metadata"]["trace_length"] == len("Error: build failed")
+
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager")
+    @patch("gitlab_analyzer.core.analysis.parse_job_logs")
+    async def test_unfinished_or_other_job_is_parsed_again(
+        self, mock_parse, _mock_cache
+    ):
+        """Test that running jobs and other job ids are not served from the cache"""
+        mock_parse.return_value = self.PARSED
+
+        await self._analyze(job_status="running")
+        await self._analyze(job_status="running")
+        await self._analyze()
+        await self._analyze(job_id=1002)
+
+        assert mock_parse.call_count == 4
+        assert not job_analysis_tools.is_job_parse_cached(
+            "test-project", 1001, "build", "build", None, "running"
+        )
+
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager")
+    @patch("gitlab_analyzer.core.analysis.parse_job_logs")
+    async def test_cached_result_is_not_shared(self, mock_parse, _mock_cache):
+        """Test that mutating a returned analysis does not affect later hits"""
+        mock_parse.return_value = {
+            **self.PARSED,
+            "errors": [{"message": "Error", "traceback": [{"line": 1}]}],
+        }
+
+        first = await self._analyze()
+        first["errors"][0]["traceback"].append({"line": 2})
+        second = await self._analyze(trace=None)
+
+        assert second["errors"][0]["traceback"] == [{"line": 1}]
+
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_gitlab_analyzer")
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager")
+    @patch("gitlab_analyzer.core.analysis.parse_job_logs")
+    async def test_missing_trace_is_downloaded(
+        self, mock_parse, _mock_cache, mock_get_analyzer
+    ):
+        """Test that a trace is fetched when no cached result is available"""
+        mock_parse.return_value = self.PARSED
+        mock_get_analyzer.return_value.get_job_trace = AsyncMock(
+            return_value="Error: build failed"
+        )
+
+        result = await self._analyze(trace=None)
+
+        mock_get_analyzer.return_value.get_job_trace.assert_awaited_once_with(
+            "test-project", 1001
+        )
+        assert result["total_errors"] == 1
+
+    @patch("gitlab_analyzer.mcp.tools.job_analysis_tools.get_cache_manager")
+    @patch("gitlab_analyzer.core.analysis.parse_job_logs")
+    async def test_cache_is_bounded(self, mock_parse, _mock_cache, monkeypatch):
+        """Test that the least recently used result is evicted"""
+        mock_parse.return_value = self.PARSED
+        monkeypatch.setattr(job_analysis_tools, "PARSE_CACHE_SIZE", 2)
+
+        await self._analyze(job_id=1)
+        await self._analyze(job_id=2)
+        await self._analyze(job_id=3)
+        await self._analyze(job_id=1)
+
+        assert len(job_analysis_tools._PARSE_CACHE) == 2
+        assert mock_parse.call_count == 4